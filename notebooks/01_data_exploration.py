@@ -9,6 +9,9 @@ sys.path.append(str(Path.cwd().parent / "src"))
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -18,23 +21,48 @@ sns.set_palette("husl")
 
 print("Setup complete!")
 
-# Load raw data
+# Load raw data (a Parquet copy, named after the CSV's mtime, is cached in the
+# ignored processed-data cache directory for fast reloads)
 raw_data_path = Path("../data/raw/sample_rb_data.csv")
-df = pd.read_csv(raw_data_path)
+cache_dir = Path("../data/processed/.csv_cache")
+parquet_path = cache_dir / f"{raw_data_path.stem}.{raw_data_path.stat().st_mtime_ns}.parquet"
+
+if parquet_path.exists():
+    df = pd.read_parquet(parquet_path)
+else:
+    column_types = {
+        'season': pa.int16(),
+        'week': pa.int8(),
+        'player_name': pa.string(),
+        'team': pa.string(),
+        'fantasy_points': pa.float32(),
+        'projection': pa.float32(),
+        'over_performed': pa.bool_(),
+    }
+    table = pacsv.read_csv(raw_data_path, convert_options=pacsv.ConvertOptions(column_types=column_types))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, parquet_path)
+    df = table.to_pandas()
 
 print(f"Dataset shape: {df.shape}")
 print(f"Columns: {list(df.columns)}")
 print(df.head())
 
-# Basic statistics
+# Basic statistics (categorical columns keep their distinct values precomputed)
+for col in ['season', 'week', 'player_name', 'team']:
+    df[col] = df[col].astype('category')
+
 print("\nDataset Overview:")
-print(f"- Seasons: {df['season'].unique()}")
-print(f"- Weeks per season: {df['week'].nunique()}")
-print(f"- Players: {df['player_name'].nunique()}")
-print(f"- Teams: {df['team'].nunique()}")
+print(f"- Seasons: {df['season'].cat.categories.to_numpy()}")
+print(f"- Weeks per season: {len(df['week'].cat.categories)}")
+print(f"- Players: {len(df['player_name'].cat.categories)}")
+print(f"- Teams: {len(df['team'].cat.categories)}")
 
+# Over-performance rate in a single pass
+over_rate = df['over_performed'].mean()
 print("\nTarget Distribution:")
-print(df['over_performed'].value_counts(normalize=True))
+print(f"- Over-performed: {over_rate:.1%}")
+print(f"- Under-performed: {1 - over_rate:.1%}")
 
 # Fantasy points distribution
 plt.figure(figsize=(12, 4))
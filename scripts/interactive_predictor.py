@@ -6,20 +6,39 @@ A user-friendly tool that guides users through player predictions.
 
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from predict_player import PlayerPredictor
-
 
 class InteractivePredictor:
     """Interactive tool for fantasy football predictions."""
     
+    __slots__ = ('_predictor', '_pred_cache')
+    
     def __init__(self):
         """Initialize the interactive predictor."""
-        self.predictor = PlayerPredictor("outputs/models/baseline_rf_model.joblib")
+        self._predictor = None
+        self._pred_cache: Dict[Tuple[str, int, int], Dict] = {}
+    
+    @property
+    def predictor(self):
+        """Player predictor, created on first use so Help/Exit start instantly."""
+        if self._predictor is None:
+            from predict_player import PlayerPredictor
+            self._predictor = PlayerPredictor("outputs/models/baseline_rf_model.joblib")
+        return self._predictor
+    
+    def _cached_predict(self, player_name: str, week: int, season: int) -> Dict:
+        """Predict a player, reusing results already computed this session."""
+        key = (player_name.lower(), week, season)
+        result = self._pred_cache.get(key)
+        if result is None:
+            result = self.predictor.predict_player(player_name, week, season)
+            if "error" not in result:
+                self._pred_cache[key] = result
+        return result
     
     def run(self):
         """Run the interactive prediction tool."""
@@ -28,19 +47,21 @@ class InteractivePredictor:
         print("This tool will help you predict player performance.")
         print("Let's get started!\n")
         
+        menu_actions = {
+            "1": self._single_player_prediction,
+            "2": self._weekly_report,
+            "3": self._player_comparison,
+            "4": self._show_help,
+        }
+        
         while True:
             try:
                 # Get user choice
                 choice = self._get_main_menu_choice()
                 
-                if choice == "1":
-                    self._single_player_prediction()
-                elif choice == "2":
-                    self._weekly_report()
-                elif choice == "3":
-                    self._player_comparison()
-                elif choice == "4":
-                    self._show_help()
+                action = menu_actions.get(choice)
+                if action is not None:
+                    action()
                 elif choice == "5":
                     print("\n👋 Thanks for using the Fantasy Football Predictor!")
                     print("Good luck with your fantasy team! 🏈")
@@ -91,7 +112,7 @@ class InteractivePredictor:
         
         # Make prediction
         print(f"\n🏈 Analyzing {player_name} for Week {week}, {season}...")
-        result = self.predictor.predict_player(player_name, week, season)
+        result = self._cached_predict(player_name, week, season)
         
         # Display results
         self.predictor.display_prediction(result)
@@ -117,10 +138,11 @@ class InteractivePredictor:
             return
         
         # Get players
-        print("\nEnter player names (one per line, press Enter twice when done):")
+        # Read stdin directly so a pasted block of names is consumed in one go
+        print("\nPaste or enter player names, one per line (blank line to finish):")
         players = []
-        while True:
-            player = input("Player: ").strip()
+        for line in iter(sys.stdin.readline, ''):
+            player = line.strip()
             if not player:
                 break
             players.append(player)
@@ -131,12 +153,11 @@ class InteractivePredictor:
         
         # Generate report
         from weekly_report import WeeklyReportGenerator
-        generator = WeeklyReportGenerator()
+        generator = WeeklyReportGenerator(predictor=self.predictor)
         
         if players:
             print(f"\n🏈 Generating report for {len(players)} players...")
-            for player in players:
-                generator.add_player(player, week, season)
+            generator.add_players(players, week, season)
         else:
             print(f"\n🏈 Generating sample report...")
             generator.add_sample_players(week, season)
@@ -179,8 +200,8 @@ class InteractivePredictor:
         # Get predictions
         print(f"\n🏈 Comparing {player1} vs {player2} for Week {week}...")
         
-        result1 = self.predictor.predict_player(player1, week, season)
-        result2 = self.predictor.predict_player(player2, week, season)
+        result1 = self._cached_predict(player1, week, season)
+        result2 = self._cached_predict(player2, week, season)
         
         # Display comparison
         self._display_comparison(result1, result2)
@@ -191,35 +212,40 @@ class InteractivePredictor:
             print("❌ Could not complete comparison due to errors.")
             return
         
-        print("\n" + "=" * 80)
-        print("⚖️  PLAYER COMPARISON RESULTS")
-        print("=" * 80)
-        
-        print(f"{'Metric':<20} {'Player 1':<30} {'Player 2':<30}")
-        print("-" * 80)
+        p1_prediction = 'OVER-PERFORM' if result1['prediction'] == 1 else 'UNDER-PERFORM'
+        p2_prediction = 'OVER-PERFORM' if result2['prediction'] == 1 else 'UNDER-PERFORM'
         
-        print(f"{'Player Name':<20} {result1['player_name']:<30} {result2['player_name']:<30}")
-        print(f"{'Projection':<20} {result1['projection']:<30.1f} {result2['projection']:<30.1f}")
-        print(f"{'Prediction':<20} {'OVER-PERFORM' if result1['prediction'] == 1 else 'UNDER-PERFORM':<30} {'OVER-PERFORM' if result2['prediction'] == 1 else 'UNDER-PERFORM':<30}")
-        print(f"{'Confidence':<20} {result1['confidence']:<30} {result2['confidence']:<30}")
-        print(f"{'Over-Perform %':<20} {result1['over_perform_probability']:<30.1%} {result2['over_perform_probability']:<30.1%}")
-        print(f"{'Recommendation':<20} {result1['recommendation']:<30} {result2['recommendation']:<30}")
-        
-        print("\n" + "=" * 80)
+        lines = [
+            "\n" + "=" * 80,
+            "⚖️  PLAYER COMPARISON RESULTS",
+            "=" * 80,
+            f"{'Metric':<20} {'Player 1':<30} {'Player 2':<30}",
+            "-" * 80,
+            f"{'Player Name':<20} {result1['player_name']:<30} {result2['player_name']:<30}",
+            f"{'Projection':<20} {result1['projection']:<30.1f} {result2['projection']:<30.1f}",
+            f"{'Prediction':<20} {p1_prediction:<30} {p2_prediction:<30}",
+            f"{'Confidence':<20} {result1['confidence']:<30} {result2['confidence']:<30}",
+            f"{'Over-Perform %':<20} {result1['over_perform_probability']:<30.1%} {result2['over_perform_probability']:<30.1%}",
+            f"{'Recommendation':<20} {result1['recommendation']:<30} {result2['recommendation']:<30}",
+            "\n" + "=" * 80,
+        ]
         
         # Determine winner
         if result1['over_perform_probability'] > result2['over_perform_probability']:
             winner = result1['player_name']
             margin = result1['over_perform_probability'] - result2['over_perform_probability']
-            print(f"🏆 RECOMMENDATION: {winner} (by {margin:.1%})")
+            lines.append(f"🏆 RECOMMENDATION: {winner} (by {margin:.1%})")
         elif result2['over_perform_probability'] > result1['over_perform_probability']:
             winner = result2['player_name']
             margin = result2['over_perform_probability'] - result1['over_perform_probability']
-            print(f"🏆 RECOMMENDATION: {winner} (by {margin:.1%})")
+            lines.append(f"🏆 RECOMMENDATION: {winner} (by {margin:.1%})")
         else:
-            print("🤝 RECOMMENDATION: Tie - both players have similar probabilities")
+            lines.append("🤝 RECOMMENDATION: Tie - both players have similar probabilities")
+        
+        lines.append("=" * 80)
         
-        print("=" * 80)
+        # Write the whole table at once
+        print("\n".join(lines))
     
     def _get_week_input(self) -> int:
         """Get week input from user."""
@@ -264,15 +290,18 @@ class InteractivePredictor:
             filename = "prediction.txt"
         
         try:
+            lines = [
+                "FANTASY FOOTBALL PREDICTION",
+                "=" * 40,
+                f"Player: {result['player_name']}",
+                f"Week: {result['week']} ({result['season']})",
+                f"Projection: {result['projection']:.1f} fantasy points",
+                f"Prediction: {'OVER-PERFORM' if result['prediction'] == 1 else 'UNDER-PERFORM'}",
+                f"Confidence: {result['confidence']} ({result['over_perform_probability']:.1%})",
+                f"Recommendation: {result['recommendation']}",
+            ]
             with open(filename, 'w') as f:
-                f.write("FANTASY FOOTBALL PREDICTION\n")
-                f.write("=" * 40 + "\n")
-                f.write(f"Player: {result['player_name']}\n")
-                f.write(f"Week: {result['week']} ({result['season']})\n")
-                f.write(f"Projection: {result['projection']:.1f} fantasy points\n")
-                f.write(f"Prediction: {'OVER-PERFORM' if result['prediction'] == 1 else 'UNDER-PERFORM'}\n")
-                f.write(f"Confidence: {result['confidence']} ({result['over_perform_probability']:.1%})\n")
-                f.write(f"Recommendation: {result['recommendation']}\n")
+                f.write("\n".join(lines) + "\n")
             
             print(f"✅ Prediction saved to {filename}")
         except Exception as e:
@@ -5,6 +5,7 @@ Demonstrates how to use the trained model to make predictions.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import joblib
@@ -16,22 +17,30 @@ from src.data.collect_data import FantasyDataCollector
 from src.features.feature_engineering import FeatureEngineer
 
 
-def load_model():
-    """Load the trained model and feature columns."""
-    model_path = Path("outputs/models/baseline_rf_model.joblib")
-    feature_path = Path("outputs/models/feature_columns.txt")
+def load_model(model_path: str = "outputs/models/baseline_rf_model.joblib"):
+    """Load the trained model and feature columns (cached per model file version)."""
+    model_path = Path(model_path)
     
     if not model_path.exists():
         raise FileNotFoundError("Model not found. Please run train_baseline.py first.")
     
+    # The modification time is part of the key, so a retrained model is reloaded
+    return _load_model(model_path.resolve(), model_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_path: Path, model_mtime_ns: int):
+    """Load the model and feature columns for one version of the model file."""
+    feature_path = model_path.parent / "feature_columns.txt"
+    
     # Load model
     model = joblib.load(model_path)
     
     # Load feature columns
     with open(feature_path, 'r') as f:
-        feature_columns = [line.strip() for line in f.readlines()]
+        feature_columns = f.read().splitlines()
     
-    return model, feature_columns
+    return model, tuple(feature_columns)
 
 
 def make_predictions(model, feature_columns, data):
@@ -44,21 +53,20 @@ def make_predictions(model, feature_columns, data):
         data: DataFrame with features
         
     Returns:
-        DataFrame with predictions
+        DataFrame with prediction columns, aligned on the index of data
     """
     # Select features
-    X = data[feature_columns].fillna(0)
-    
-    # Make predictions
-    predictions = model.predict(X)
-    probabilities = model.predict_proba(X)[:, 1]
+    X = data[list(feature_columns)].fillna(0)
     
-    # Add predictions to data
-    result = data.copy()
-    result['predicted_over_perform'] = predictions
-    result['over_perform_probability'] = probabilities
+    # One forest pass gives both outputs; predict() is the argmax of these
+    class_probabilities = model.predict_proba(X)
+    predictions = model.classes_[class_probabilities.argmax(axis=1)]
     
-    return result
+    # Return only the new columns so callers can join without copying data
+    return pd.DataFrame({
+        'predicted_over_perform': predictions,
+        'over_perform_probability': class_probabilities[:, 1]
+    }, index=data.index)
 
 
 def main():
@@ -91,9 +99,8 @@ def main():
     print("=" * 40)
     
     # Sample predictions
-    sample_predictions = predictions[['player_name', 'team', 'week', 'fantasy_points', 
-                                    'projection', 'predicted_over_perform', 
-                                    'over_perform_probability']].head(10)
+    sample_predictions = engineered_data[['player_name', 'team', 'week', 'fantasy_points', 
+                                          'projection']].head(10).join(predictions)
     
     print(sample_predictions.to_string(index=False))
     
@@ -108,7 +115,9 @@ def main():
     high_conf = predictions[predictions['over_perform_probability'] > 0.8]
     print(f"\nHigh confidence over-perform predictions (>80%):")
     if len(high_conf) > 0:
-        print(high_conf[['player_name', 'team', 'week', 'over_perform_probability']].head(5).to_string(index=False))
+        high_conf = engineered_data[['player_name', 'team', 'week']].join(
+            high_conf['over_perform_probability'], how='inner')
+        print(high_conf.head(5).to_string(index=False))
     else:
         print("No high confidence predictions found.")
     
@@ -54,12 +54,12 @@ def main():
     engineered_data = engineer.engineer_all_features(offensive_data)
     
     # Save engineered data
-    engineer.save_engineered_data(engineered_data, "nfl_offensive_engineered.csv")
+    engineer.save_engineered_data(engineered_data, "nfl_offensive_engineered.parquet")
     
     # Step 3: Model Training and Evaluation
     print("\n5. Training baseline model...")
     model = BaselineModel()
-    results = model.train_and_evaluate("data/processed/nfl_offensive_engineered.csv")
+    results = model.train_and_evaluate("data/processed/nfl_offensive_engineered.parquet")
     
     # Step 4: Results Summary
     print("\n" + "=" * 60)
@@ -7,8 +7,6 @@ Generates comprehensive weekly predictions for multiple players.
 import argparse
 import sys
 from pathlib import Path
-import pandas as pd
-import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -17,14 +15,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from predict_player import PlayerPredictor
 
+# Prediction fields kept for each player in the report, in CSV column order
+REPORT_COLUMNS = [
+    'player_name', 'week', 'season', 'projection', 'prediction',
+    'over_perform_probability', 'confidence', 'recommendation'
+]
+
+# Fixed report sections, built once rather than line by line on every report
+_RANKINGS_HEADER = (
+    "📋 FULL RANKINGS (by Over-Perform Probability)",
+    "-" * 40,
+    f"{'Rank':<4} {'Player':<20} {'Projection':<10} {'Over-Perform':<12} {'Confidence':<10} {'Recommendation'}",
+    "-" * 80,
+)
+_REPORT_FOOTER = (
+    "",
+    "=" * 80,
+    "💡 TIPS:",
+    "• Use this report as one tool in your decision-making process",
+    "• Consider injuries, weather, and other factors not captured here",
+    "• High confidence predictions (>80%) are more reliable",
+    "• Always check the latest news before making final decisions",
+    "=" * 80,
+)
+
 
 class WeeklyReportGenerator:
     """Generate weekly fantasy football prediction reports."""
     
-    def __init__(self, model_path: str = "outputs/models/baseline_rf_model.joblib"):
-        """Initialize the report generator."""
-        self.predictor = PlayerPredictor(model_path)
-        self.report_data = []
+    def __init__(self, model_path: str = "outputs/models/baseline_rf_model.joblib",
+                 predictor: Optional[PlayerPredictor] = None):
+        """Initialize the report generator, optionally sharing an existing predictor."""
+        self.predictor = predictor if predictor is not None else PlayerPredictor(model_path)
+        # Column store of report rows, one list per field in REPORT_COLUMNS
+        self.report_columns: Dict[str, list] = {column: [] for column in REPORT_COLUMNS}
+    
+    def _append_result(self, result: Dict):
+        """Append a successful prediction to the report columns."""
+        for column, values in self.report_columns.items():
+            values.append(result[column])
+    
+    def _report_rows(self) -> List[Dict]:
+        """Get the report rows as dictionaries."""
+        return [dict(zip(REPORT_COLUMNS, row)) for row in zip(*self.report_columns.values())]
     
     def add_player(self, player_name: str, week: int, season: int = 2023) -> Dict:
         """Add a player to the weekly report."""
@@ -33,13 +66,28 @@ class WeeklyReportGenerator:
         result = self.predictor.predict_player(player_name, week, season)
         
         if "error" not in result:
-            self.report_data.append(result)
+            self._append_result(result)
             print(f"✅ Added {player_name}: {result['recommendation']}")
         else:
             print(f"❌ Failed to add {player_name}: {result['error']}")
         
         return result
     
+    def add_players(self, player_names: List[str], week: int, season: int = 2023) -> List[Dict]:
+        """Add several players to the weekly report using one batched prediction."""
+        print(f"📊 Adding {len(player_names)} players to week {week} report...")
+        
+        results = self.predictor.predict_players_batch(player_names, week, season)
+        
+        for player_name, result in zip(player_names, results):
+            if "error" not in result:
+                self._append_result(result)
+                print(f"✅ Added {player_name}: {result['recommendation']}")
+            else:
+                print(f"❌ Failed to add {player_name}: {result['error']}")
+        
+        return results
+    
     def add_sample_players(self, week: int, season: int = 2023):
         """Add sample players for demonstration."""
         sample_players = [
@@ -57,17 +105,20 @@ class WeeklyReportGenerator:
         
         print(f"🏈 Adding {len(sample_players)} sample players to week {week} report...")
         
-        for player in sample_players:
-            self.add_player(player, week, season)
+        self.add_players(sample_players, week, season)
     
     def generate_report(self, week: int, season: int = 2023, output_file: str = None) -> str:
         """Generate a comprehensive weekly report."""
-        if not self.report_data:
+        import numpy as np
+        
+        if not self.report_columns['player_name']:
             print("📝 No players in report. Adding sample players...")
             self.add_sample_players(week, season)
         
-        # Sort by over-perform probability
-        sorted_data = sorted(self.report_data, key=lambda x: x['over_perform_probability'], reverse=True)
+        # Sort by over-perform probability (stable, so ties keep insertion order)
+        probabilities = np.asarray(self.report_columns['over_perform_probability'], dtype=float)
+        rows = self._report_rows()
+        sorted_data = [rows[i] for i in np.argsort(-probabilities, kind='stable')]
         
         # Generate report
         report = self._format_report(sorted_data, week, season)
@@ -80,106 +131,78 @@ class WeeklyReportGenerator:
     
     def _format_report(self, data: List[Dict], week: int, season: int) -> str:
         """Format the report as a string."""
-        report_lines = []
+        import numpy as np
         
         # Header
-        report_lines.append("=" * 80)
-        report_lines.append(f"🏈 FANTASY FOOTBALL WEEKLY REPORT - WEEK {week}, {season}")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Total Players: {len(data)}")
-        report_lines.append("")
+        report_lines = [
+            "=" * 80,
+            f"🏈 FANTASY FOOTBALL WEEKLY REPORT - WEEK {week}, {season}",
+            "=" * 80,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Total Players: {len(data)}",
+            "",
+        ]
         
-        # Summary
-        over_perform_count = sum(1 for player in data if player['prediction'] == 1)
+        # Partition players into recommendation buckets in a single pass
+        buckets = {"strong": [], "consider": [], "avoid": [], "bench": []}
+        probabilities = []
+        over_perform_count = 0
+        for player in data:
+            probability = player['over_perform_probability']
+            probabilities.append(probability)
+            if player['prediction'] == 1:
+                over_perform_count += 1
+                if probability >= 0.7:
+                    buckets["strong"].append(player)
+                elif probability >= 0.5:
+                    buckets["consider"].append(player)
+            elif probability >= 0.7:
+                buckets["avoid"].append(player)
+            elif 0.3 <= probability < 0.5:
+                buckets["bench"].append(player)
         under_perform_count = len(data) - over_perform_count
         
-        report_lines.append("📊 SUMMARY")
-        report_lines.append("-" * 40)
-        report_lines.append(f"Over-Perform Predictions: {over_perform_count}")
-        report_lines.append(f"Under-Perform Predictions: {under_perform_count}")
-        report_lines.append(f"Average Confidence: {np.mean([p['over_perform_probability'] for p in data]):.1%}")
-        report_lines.append("")
-        
-        # Strong Starts (High confidence over-perform)
-        strong_starts = [p for p in data if p['prediction'] == 1 and p['over_perform_probability'] >= 0.7]
-        if strong_starts:
-            report_lines.append("🔥 STRONG STARTS")
-            report_lines.append("-" * 40)
-            for player in strong_starts:
-                report_lines.append(
-                    f"• {player['player_name']:<20} "
-                    f"Projection: {player['projection']:>5.1f} | "
-                    f"Over-Perform: {player['over_perform_probability']:>5.1%} | "
-                    f"Confidence: {player['confidence']}"
-                )
-            report_lines.append("")
+        report_lines.extend([
+            "📊 SUMMARY",
+            "-" * 40,
+            f"Over-Perform Predictions: {over_perform_count}",
+            f"Under-Perform Predictions: {under_perform_count}",
+            f"Average Confidence: {np.mean(probabilities):.1%}",
+            "",
+        ])
         
-        # Consider Starting (Medium confidence over-perform)
-        consider_starts = [p for p in data if p['prediction'] == 1 and 0.5 <= p['over_perform_probability'] < 0.7]
-        if consider_starts:
-            report_lines.append("🤔 CONSIDER STARTING")
-            report_lines.append("-" * 40)
-            for player in consider_starts:
-                report_lines.append(
-                    f"• {player['player_name']:<20} "
-                    f"Projection: {player['projection']:>5.1f} | "
-                    f"Over-Perform: {player['over_perform_probability']:>5.1%} | "
-                    f"Confidence: {player['confidence']}"
-                )
-            report_lines.append("")
-        
-        # Avoid (High confidence under-perform)
-        avoid_players = [p for p in data if p['prediction'] == 0 and p['over_perform_probability'] >= 0.7]
-        if avoid_players:
-            report_lines.append("⚠️  AVOID")
-            report_lines.append("-" * 40)
-            for player in avoid_players:
-                report_lines.append(
-                    f"• {player['player_name']:<20} "
-                    f"Projection: {player['projection']:>5.1f} | "
-                    f"Over-Perform: {player['over_perform_probability']:>5.1%} | "
-                    f"Confidence: {player['confidence']}"
-                )
-            report_lines.append("")
-        
-        # Consider Benching (Medium confidence under-perform)
-        consider_bench = [p for p in data if p['prediction'] == 0 and 0.3 <= p['over_perform_probability'] < 0.5]
-        if consider_bench:
-            report_lines.append("🛋️  CONSIDER BENCHING")
-            report_lines.append("-" * 40)
-            for player in consider_bench:
-                report_lines.append(
+        # Strong Starts, Consider Starting, Avoid and Consider Benching sections
+        sections = [
+            ("🔥 STRONG STARTS", buckets["strong"]),
+            ("🤔 CONSIDER STARTING", buckets["consider"]),
+            ("⚠️  AVOID", buckets["avoid"]),
+            ("🛋️  CONSIDER BENCHING", buckets["bench"]),
+        ]
+        for title, players in sections:
+            if players:
+                report_lines.extend((title, "-" * 40))
+                report_lines.extend(
                     f"• {player['player_name']:<20} "
                     f"Projection: {player['projection']:>5.1f} | "
                     f"Over-Perform: {player['over_perform_probability']:>5.1%} | "
                     f"Confidence: {player['confidence']}"
+                    for player in players
                 )
-            report_lines.append("")
+                report_lines.append("")
         
         # Full Rankings
-        report_lines.append("📋 FULL RANKINGS (by Over-Perform Probability)")
-        report_lines.append("-" * 40)
-        report_lines.append(f"{'Rank':<4} {'Player':<20} {'Projection':<10} {'Over-Perform':<12} {'Confidence':<10} {'Recommendation'}")
-        report_lines.append("-" * 80)
+        report_lines.extend(_RANKINGS_HEADER)
         
-        for i, player in enumerate(data, 1):
-            report_lines.append(
-                f"{i:<4} {player['player_name']:<20} "
-                f"{player['projection']:<10.1f} "
-                f"{player['over_perform_probability']:<12.1%} "
-                f"{player['confidence']:<10} "
-                f"{player['recommendation']}"
-            )
+        report_lines.extend(
+            f"{i:<4} {player['player_name']:<20} "
+            f"{player['projection']:<10.1f} "
+            f"{player['over_perform_probability']:<12.1%} "
+            f"{player['confidence']:<10} "
+            f"{player['recommendation']}"
+            for i, player in enumerate(data, 1)
+        )
         
-        report_lines.append("")
-        report_lines.append("=" * 80)
-        report_lines.append("💡 TIPS:")
-        report_lines.append("• Use this report as one tool in your decision-making process")
-        report_lines.append("• Consider injuries, weather, and other factors not captured here")
-        report_lines.append("• High confidence predictions (>80%) are more reliable")
-        report_lines.append("• Always check the latest news before making final decisions")
-        report_lines.append("=" * 80)
+        report_lines.extend(_REPORT_FOOTER)
         
         return "\n".join(report_lines)
     
@@ -195,24 +218,17 @@ class WeeklyReportGenerator:
     
     def export_csv(self, output_file: str = None):
         """Export the report data as CSV."""
-        if not self.report_data:
+        if not self.report_columns['player_name']:
             print("❌ No data to export")
             return
         
-        df = pd.DataFrame(self.report_data)
-        
-        # Reorder columns for better readability
-        column_order = [
-            'player_name', 'week', 'season', 'projection', 'prediction',
-            'over_perform_probability', 'confidence', 'recommendation'
-        ]
+        import pandas as pd
         
-        # Only include columns that exist
-        existing_columns = [col for col in column_order if col in df.columns]
-        df = df[existing_columns]
+        # Columns are already typed lists in the output order, so no per-row inference
+        df = pd.DataFrame(self.report_columns)
         
         if output_file is None:
-            output_file = f"week_{self.report_data[0]['week']}_predictions.csv"
+            output_file = f"week_{self.report_columns['week'][0]}_predictions.csv"
         
         output_path = Path(output_file)
         df.to_csv(output_path, index=False)
@@ -244,8 +260,7 @@ def main():
     # Add players
     if args.players:
         print(f"🏈 Analyzing {len(args.players)} players for Week {args.week}...")
-        for player in args.players:
-            generator.add_player(player, args.week, args.season)
+        generator.add_players(args.players, args.week, args.season)
     else:
         print(f"🏈 Generating sample report for Week {args.week}...")
         generator.add_sample_players(args.week, args.season)
@@ -30,7 +30,10 @@ def create_virtual_environment():
     
     print("🔧 Creating virtual environment...")
     try:
-        subprocess.run([sys.executable, "-m", "venv", ".venv"], check=True)
+        # Create the bare environment, then bootstrap pip from the bundled wheel
+        subprocess.run([sys.executable, "-m", "venv", "--without-pip", ".venv"], check=True)
+        subprocess.run([str(get_venv_python()), "-m", "ensurepip", "--upgrade", "--default-pip"],
+                       check=True)
         print("✅ Virtual environment created successfully")
         return venv_path
     except subprocess.CalledProcessError as e:
@@ -56,9 +59,17 @@ def install_dependencies():
         print(f"❌ Error: pip not found at {pip_path}")
         sys.exit(1)
     
+    # Skip pip's once-per-run version check against PyPI
+    pip_env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+    
     print("📦 Installing dependencies...")
     try:
-        subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+        # Current build tooling understands the newest wheel tags, so binaries are found
+        subprocess.run([str(pip_path), "install", "-U", "pip", "setuptools", "wheel"],
+                       check=True, env=pip_env)
+        # Take a wheel over a newer sdist rather than compiling from source
+        subprocess.run([str(pip_path), "install", "--prefer-binary", "-r", "requirements.txt"],
+                       check=True, env=pip_env)
         print("✅ Dependencies installed successfully")
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing dependencies: {e}")
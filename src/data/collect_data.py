@@ -13,6 +13,7 @@ import random
 from datetime import datetime, timedelta
 
 from ..utils.config import load_config, get_data_paths, ensure_directories
+from ..utils.io import write_csv
 
 
 class FantasyDataCollector:
@@ -31,6 +32,10 @@ class FantasyDataCollector:
         self.paths = get_data_paths(self.config)
         ensure_directories(self.config)
         
+        # One generator per collector; a configured seed makes sample data reproducible
+        seed = self.config.get('data_collection', {}).get('seed')
+        self._rng = np.random.default_rng(seed)
+        
     def create_sample_data(self, output_file: str = "sample_rb_data.csv") -> pd.DataFrame:
         """
         Create sample running back data for MVP testing.
@@ -48,8 +53,6 @@ class FantasyDataCollector:
         weeks_per_season = 18
         num_players = 50
         
-        data = []
-        
         # Sample RB names
         rb_names = [
             "Christian McCaffrey", "Saquon Barkley", "Derrick Henry", "Nick Chubb",
@@ -69,66 +72,63 @@ class FantasyDataCollector:
         
         teams = ["SF", "NYG", "TEN", "CLE", "LAC", "MIN", "NO", "CIN", "LV", "PHI"]
         
-        for season in seasons:
-            for week in range(1, weeks_per_season + 1):
-                for player_idx in range(num_players):
-                    player_name = rb_names[player_idx % len(rb_names)]
-                    team = teams[player_idx % len(teams)]
-                    
-                    # Generate realistic fantasy stats
-                    rushing_yards = np.random.normal(70, 30)
-                    rushing_yards = max(0, int(rushing_yards))
-                    
-                    rushing_tds = np.random.poisson(0.5)
-                    
-                    receptions = np.random.poisson(2.5)
-                    receiving_yards = np.random.normal(20, 15)
-                    receiving_yards = max(0, int(receiving_yards))
-                    
-                    receiving_tds = np.random.poisson(0.2)
-                    
-                    fumbles = np.random.poisson(0.1)
-                    
-                    # Calculate fantasy points (standard scoring)
-                    fantasy_points = (
-                        rushing_yards * 0.1 +
-                        rushing_tds * 6 +
-                        receptions * 1 +
-                        receiving_yards * 0.1 +
-                        receiving_tds * 6 -
-                        fumbles * 2
-                    )
-                    
-                    # Generate projection (with some variance)
-                    projection = fantasy_points + np.random.normal(0, 3)
-                    projection = max(0, projection)
-                    
-                    # Determine if over/under performed
-                    over_performed = fantasy_points > projection
-                    
-                    data.append({
-                        'season': season,
-                        'week': week,
-                        'player_name': player_name,
-                        'team': team,
-                        'position': 'RB',
-                        'rushing_yards': rushing_yards,
-                        'rushing_touchdowns': rushing_tds,
-                        'receptions': receptions,
-                        'receiving_yards': receiving_yards,
-                        'receiving_touchdowns': receiving_tds,
-                        'fumbles_lost': fumbles,
-                        'fantasy_points': round(fantasy_points, 2),
-                        'projection': round(projection, 2),
-                        'over_performed': over_performed,
-                        'performance_diff': round(fantasy_points - projection, 2)
-                    })
-        
-        df = pd.DataFrame(data)
+        # One row per (season, week, player), in season -> week -> player order
+        n_rows = len(seasons) * weeks_per_season * num_players
+        season_col = np.repeat(seasons, weeks_per_season * num_players)
+        week_col = np.tile(np.repeat(np.arange(1, weeks_per_season + 1), num_players), len(seasons))
+        player_idx = np.tile(np.arange(num_players), len(seasons) * weeks_per_season)
+        
+        # Repeated labels are stored as categorical codes; sorted categories keep
+        # sorting and get_dummies column order identical to plain strings
+        name_categories, name_codes = np.unique(rb_names, return_inverse=True)
+        team_categories, team_codes = np.unique(teams, return_inverse=True)
+        
+        # Generate realistic fantasy stats for every row at once
+        rushing_yards = np.clip(self._rng.normal(70, 30, n_rows), 0, None).astype(np.int64)
+        rushing_tds = self._rng.poisson(0.5, n_rows)
+        receptions = self._rng.poisson(2.5, n_rows)
+        receiving_yards = np.clip(self._rng.normal(20, 15, n_rows), 0, None).astype(np.int64)
+        receiving_tds = self._rng.poisson(0.2, n_rows)
+        fumbles = self._rng.poisson(0.1, n_rows)
+        
+        # Calculate fantasy points (standard scoring)
+        fantasy_points = (
+            rushing_yards * 0.1 +
+            rushing_tds * 6 +
+            receptions * 1 +
+            receiving_yards * 0.1 +
+            receiving_tds * 6 -
+            fumbles * 2
+        )
+        
+        # Generate projection (with some variance)
+        projection = np.maximum(0, fantasy_points + self._rng.normal(0, 3, n_rows))
+        
+        df = pd.DataFrame({
+            'season': season_col,
+            'week': week_col,
+            'player_name': pd.Categorical.from_codes(name_codes[player_idx % len(rb_names)],
+                                                     categories=name_categories),
+            'team': pd.Categorical.from_codes(team_codes[player_idx % len(teams)],
+                                              categories=team_categories),
+            'position': pd.Categorical.from_codes(np.zeros(n_rows, dtype=np.int8),
+                                                  categories=['RB']),
+            'rushing_yards': rushing_yards,
+            'rushing_touchdowns': rushing_tds,
+            'receptions': receptions,
+            'receiving_yards': receiving_yards,
+            'receiving_touchdowns': receiving_tds,
+            'fumbles_lost': fumbles,
+            'fantasy_points': np.round(fantasy_points, 2),
+            'projection': np.round(projection, 2),
+            # Determine if over/under performed
+            'over_performed': fantasy_points > projection,
+            'performance_diff': np.round(fantasy_points - projection, 2)
+        })
         
         # Save to file
         output_path = self.paths['raw_data'] / output_file
-        df.to_csv(output_path, index=False)
+        write_csv(df, output_path)
         print(f"Sample data saved to: {output_path}")
         print(f"Created {len(df)} records for {num_players} RBs across {len(seasons)} seasons")
         
@@ -3,19 +3,256 @@ NFL Data Integration Module
 Integrates real NFL player data from the hvpkod/NFL-Data repository.
 """
 
+import functools
+import hashlib
+import logging
+import os
+import shutil
+import tarfile
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
 from datetime import datetime
-import subprocess
 import sys
 import argparse
 
 from ..utils.config import load_config, get_data_paths, ensure_directories
+from ..utils.io import write_csv
 from .player_metadata import PlayerMetadataIntegrator
 
+logger = logging.getLogger(__name__)
+
+# Snapshot of the data repository's default branch, without its git history
+NFL_DATA_ARCHIVE_URL = "https://github.com/hvpkod/NFL-Data/archive/HEAD.tar.gz"
+
+# Player identifier columns shared by the actual and projected files; the
+# integer PlayerId alone identifies a row, the rest are taken from actual data
+_MERGE_KEY = 'PlayerId'
+_IDENTIFIER_COLUMNS = ['PlayerName', 'Pos', 'Team', 'PlayerOpponent']
+
+# Source column names mapped to the names used throughout the project
+_COLUMN_MAPPING = {
+    'PlayerName': 'player_name',
+    'PlayerId': 'player_id',
+    'Pos': 'position',
+    'Team': 'team',
+    'PlayerOpponent': 'opponent',
+    'RushingYDS': 'rushing_yards',
+    'RushingTD': 'rushing_touchdowns',
+    'ReceivingRec': 'receptions',
+    'ReceivingYDS': 'receiving_yards',
+    'ReceivingTD': 'receiving_touchdowns',
+    'Fum': 'fumbles_lost',
+    'TouchCarries': 'carries',
+    'Targets': 'targets',
+    'TotalPoints': 'total_points'
+}
+_COLUMN_MAPPING_KEYS = frozenset(_COLUMN_MAPPING)
+
+# Label columns that repeat every week; stored as categorical codes
+_CATEGORICAL_COLUMNS = ['player_name', 'team', 'position', 'opponent']
+
+# Threads reading weekly files at once, shared by every position collected together
+_MAX_READ_WORKERS = 16
+
+# Part of every weekly cache key; bump it whenever a change to this module alters
+# collect_weekly_data output, so older cache entries are not served
+_WEEKLY_CACHE_VERSION = 1
+
+
+def _categorize_labels(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert repeated label columns to categorical dtype.
+    
+    Args:
+        df: DataFrame with cleaned column names
+        
+    Returns:
+        DataFrame with label columns stored as categoricals
+    """
+    return df.astype({col: 'category' for col in _CATEGORICAL_COLUMNS if col in df.columns})
+
+
+def _performance_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Compute the fantasy point target columns from a merged weekly frame.
+    
+    Works on the raw column arrays, skipping pandas' index alignment.
+    
+    Args:
+        df: Merged actual/projected data
+        
+    Returns:
+        Dictionary of new column name to values
+    """
+    # Use existing fantasy points from the data
+    fantasy_points = df['TotalPoints_actual'].to_numpy(copy=False)
+    projection = df['PlayerWeekProjectedPts'].to_numpy(copy=False)
+    
+    # Calculate over/under performance
+    return {
+        'fantasy_points': fantasy_points,
+        'projection': projection,
+        'over_performed': np.greater(fantasy_points, projection),
+        'performance_diff': np.subtract(fantasy_points, projection)
+    }
+
+
+def _harmonize_dtypes(frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """
+    Cast numeric columns to one common dtype across frames before concatenation.
+    
+    A column read as bool in one week and as numbers in another would otherwise
+    be concatenated as object dtype.
+    
+    Args:
+        frames: Weekly DataFrames to be concatenated
+        
+    Returns:
+        Frames with matching dtypes for their shared numeric columns
+    """
+    column_dtypes: Dict[str, set] = {}
+    for frame in frames:
+        for col, dtype in frame.dtypes.items():
+            column_dtypes.setdefault(col, set()).add(dtype)
+    
+    target_dtypes = {}
+    for col, dtypes in column_dtypes.items():
+        if len(dtypes) > 1 and all(isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+                                   for dtype in dtypes):
+            target_dtypes[col] = np.result_type(*dtypes)
+    
+    if not target_dtypes:
+        return frames
+    
+    return [
+        frame.astype({col: dtype for col, dtype in target_dtypes.items() if col in frame.columns})
+        for frame in frames
+    ]
+
+
+def _merge_actual_projected(actual_data: pd.DataFrame, projected_data: pd.DataFrame,
+                            on: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Join actual and projected rows on the player ID.
+    
+    Args:
+        actual_data: Actual performance data
+        projected_data: Projection data
+        on: Additional key columns, e.g. season and week for multi-week frames
+        
+    Returns:
+        Merged DataFrame with _actual/_projected suffixes on shared stat columns
+    """
+    projected_stats = projected_data.drop(columns=_IDENTIFIER_COLUMNS, errors='ignore')
+    return pd.merge(actual_data, projected_stats,
+                    how='inner',
+                    on=(on or []) + [_MERGE_KEY],
+                    suffixes=('_actual', '_projected'))
+
+
+def _parse_data_file(path: str) -> pd.DataFrame:
+    """
+    Parse a CSV or Parquet data file.
+    
+    Args:
+        path: Path to the CSV or Parquet file
+        
+    Returns:
+        Parsed DataFrame
+    """
+    if path.endswith(".parquet"):
+        # Map the file so warm reads come straight from the page cache
+        return pd.read_parquet(path, memory_map=True)
+    
+    # Arrow's multithreaded reader; every column is kept since all numeric
+    # stats become model features downstream
+    return pd.read_csv(path, engine="pyarrow")
+
+
+# Sized for one default collection of a position (2 seasons x 18 weeks, actual
+# and projected files), so a long session does not hold every file it has read
+_READ_CACHE_SIZE = 2 * 18 * 2
+
+
+@functools.lru_cache(maxsize=_READ_CACHE_SIZE)
+def _read_csv_cached(path: str, mtime_ns: int) -> pd.DataFrame:
+    """
+    Read a data file once per (path, modification time).
+    
+    Args:
+        path: Path to the CSV or Parquet file
+        mtime_ns: Modification time of the file, so edited files are re-read
+        
+    Returns:
+        Parsed DataFrame (shared; callers must not modify it in place)
+    """
+    return _parse_data_file(path)
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_file: Path) -> None:
+    """
+    Materialize a parsed CSV as Parquet so later runs skip the text parse.
+    
+    The file is written to a temporary name and moved into place, so a
+    concurrent reader never sees a partial file. Failures are ignored; the
+    CSV remains the source of truth.
+    
+    Args:
+        df: Parsed CSV contents
+        cache_file: Destination Parquet path
+    """
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_file, compression="zstd", index=False)
+        os.replace(tmp_file, cache_file)
+    except (ImportError, OSError, TypeError, ValueError):
+        tmp_file.unlink(missing_ok=True)
+
+
+def _read_csv(csv_file: Path, description: str, cache_file: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Read a data file through the CSV cache.
+    
+    Args:
+        csv_file: Path to the CSV file
+        description: Kind of file, used in the not-found message
+        cache_file: Optional Parquet copy, used when newer than the CSV
+        
+    Returns:
+        Parsed DataFrame; shallow copies of cached frames rely on pandas'
+        copy-on-write, so callers must not modify values in place
+    """
+    try:
+        mtime_ns = csv_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{description} file not found: {csv_file}") from None
+    
+    if cache_file is None:
+        return _read_csv_cached(str(csv_file), mtime_ns).copy(deep=False)
+    
+    try:
+        cache_mtime_ns = cache_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        cache_mtime_ns = None
+    
+    if cache_mtime_ns is not None and cache_mtime_ns >= mtime_ns:
+        try:
+            return _read_csv_cached(str(cache_file), cache_mtime_ns).copy(deep=False)
+        except (ImportError, OSError, ValueError):
+            pass
+    
+    # Only the Parquet copy is kept in memory; the CSV is parsed once to
+    # create it and served from it afterwards
+    df = _parse_data_file(str(csv_file))
+    _write_parquet_cache(df, cache_file)
+    return df
+
 
 class NFLDataIntegrator:
     """
@@ -31,9 +268,14 @@ class NFLDataIntegrator:
             config_path: Path to configuration file
         """
         self.nfl_data_path = Path(nfl_data_path)
+        # Parquet copies of the CSVs, mirroring the NFL data layout
+        self.cache_path = self.nfl_data_path.parent / "cache"
         self.config = load_config(config_path)
         self.paths = get_data_paths(self.config)
         ensure_directories(self.config)
+        # (directory mtime, season directory mtimes, result) of the last
+        # get_available_data scan
+        self._available_data: Optional[Tuple[int, Dict[int, int], Dict[str, List[int]]]] = None
         
         if not self.nfl_data_path.exists():
             raise FileNotFoundError(f"NFL data path not found: {nfl_data_path}")
@@ -50,24 +292,84 @@ class NFLDataIntegrator:
         Returns:
             Tuple of (actual_data, projected_data)
         """
-        season_path = self.nfl_data_path / str(season) / str(week)
+        actual_file, projected_file = self._weekly_files(position, season, week)
         
         # Load actual performance data
-        actual_file = season_path / f"{position}.csv"
-        if not actual_file.exists():
-            raise FileNotFoundError(f"Actual data file not found: {actual_file}")
-        
-        actual_data = pd.read_csv(actual_file)
+        actual_data = self._read_data_file(actual_file, "Actual data")
         
         # Load projection data
-        projected_file = season_path / "projected" / f"{position}_projected.csv"
-        if not projected_file.exists():
-            raise FileNotFoundError(f"Projection data file not found: {projected_file}")
-        
-        projected_data = pd.read_csv(projected_file)
+        projected_data = self._read_data_file(projected_file, "Projection data")
         
         return actual_data, projected_data
     
+    def _weekly_files(self, position: str, season: int, week: int) -> Tuple[Path, Path]:
+        """
+        Paths of a week's actual and projected CSVs, relative to the data repository.
+        
+        Args:
+            position: Player position
+            season: NFL season year
+            week: Week number
+            
+        Returns:
+            Tuple of (actual_file, projected_file)
+        """
+        week_path = Path(str(season)) / str(week)
+        return week_path / f"{position}.csv", week_path / "projected" / f"{position}_projected.csv"
+    
+    def _week_directories(self, season: int) -> set:
+        """
+        Week numbers that have a directory for a season, from one directory scan.
+        
+        Args:
+            season: NFL season year
+            
+        Returns:
+            Set of week numbers (empty if the season is missing)
+        """
+        try:
+            with os.scandir(self.nfl_data_path / str(season)) as entries:
+                return {int(entry.name) for entry in entries
+                        if entry.name.isdigit() and entry.is_dir()}
+        except FileNotFoundError:
+            return set()
+    
+    def _weekly_cache_path(self, position: str, seasons: List[int], weeks: List[int],
+                           available_weeks: Dict[int, set]) -> Path:
+        """
+        Location of the cached collect_weekly_data result for these inputs.
+        
+        The key covers _WEEKLY_CACHE_VERSION, the request and the modification
+        time of every source file (or its absence), so any edited, added or
+        removed week is a miss.
+        
+        Args:
+            position: Player position
+            seasons: Seasons requested, in order
+            weeks: Weeks requested, in order
+            available_weeks: Output of _week_directories for each season
+            
+        Returns:
+            Path of the Parquet cache file
+        """
+        mtimes = []
+        for season in seasons:
+            for week in weeks:
+                if week not in available_weeks[season]:
+                    mtimes.extend([None, None])
+                    continue
+                
+                for relative_path in self._weekly_files(position, season, week):
+                    try:
+                        mtimes.append((self.nfl_data_path / relative_path).stat().st_mtime_ns)
+                    except FileNotFoundError:
+                        mtimes.append(None)
+        
+        key_source = repr((_WEEKLY_CACHE_VERSION, str(self.nfl_data_path.resolve()), position,
+                           list(seasons), list(weeks), mtimes))
+        key = hashlib.blake2b(key_source.encode(), digest_size=8).hexdigest()
+        return self.paths['processed_data'] / 'weekly_cache' / f"{position.lower()}_{key}.parquet"
+    
     def load_season_data(self, position: str = "RB", season: int = 2023) -> pd.DataFrame:
         """
         Load season-level data.
@@ -79,13 +381,21 @@ class NFLDataIntegrator:
         Returns:
             DataFrame with season data
         """
-        season_path = self.nfl_data_path / str(season)
-        season_file = season_path / f"{position}_season.csv"
-        
-        if not season_file.exists():
-            raise FileNotFoundError(f"Season data file not found: {season_file}")
+        return self._read_data_file(Path(str(season)) / f"{position}_season.csv", "Season data")
+    
+    def _read_data_file(self, relative_path: Path, description: str) -> pd.DataFrame:
+        """
+        Read a CSV from the NFL data repository, preferring its Parquet copy.
         
-        return pd.read_csv(season_file)
+        Args:
+            relative_path: CSV path relative to the NFL data repository
+            description: Kind of file, used in the not-found message
+            
+        Returns:
+            DataFrame with the file contents
+        """
+        return _read_csv(self.nfl_data_path / relative_path, description,
+                         self.cache_path / relative_path.with_suffix(".parquet"))
     
     def merge_weekly_data(self, actual_data: pd.DataFrame, projected_data: pd.DataFrame, 
                          season: int, week: int) -> pd.DataFrame:
@@ -101,19 +411,11 @@ class NFLDataIntegrator:
         Returns:
             Merged DataFrame
         """
-        # Select key columns for merging
-        merge_cols = ['PlayerName', 'PlayerId', 'Pos', 'Team', 'PlayerOpponent']
-        
         # Merge on player identifiers
-        merged = pd.merge(actual_data, projected_data, 
-                         on=merge_cols, 
-                         suffixes=('_actual', '_projected'))
+        merged = _merge_actual_projected(actual_data, projected_data)
         
         # Add metadata
-        merged['season'] = season
-        merged['week'] = week
-        
-        return merged
+        return merged.assign(season=season, week=week)
     
     def calculate_fantasy_points(self, df: pd.DataFrame, scoring_type: str = "standard") -> pd.DataFrame:
         """
@@ -126,19 +428,25 @@ class NFLDataIntegrator:
         Returns:
             DataFrame with fantasy points added
         """
-        df = df.copy()
-        
-
-        
-        # Use existing fantasy points from the data
-        df['fantasy_points'] = df['TotalPoints_actual']
-        df['projection'] = df['PlayerWeekProjectedPts']
-        
-        # Calculate over/under performance
-        df['over_performed'] = df['fantasy_points'] > df['projection']
-        df['performance_diff'] = df['fantasy_points'] - df['projection']
+        # assign returns a new frame, so the input is left untouched without
+        # a defensive copy
+        return df.assign(**_performance_columns(df))
+    
+    def _load_tagged_week(self, position: str, season: int, week: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load one week of actual and projected data, tagged with its season and week.
         
-        return df
+        Args:
+            position: Player position
+            season: NFL season year
+            week: Week number
+            
+        Returns:
+            Tuple of (actual_data, projected_data) with season and week columns
+        """
+        actual_data, projected_data = self.load_weekly_data(position, season, week)
+        return (actual_data.assign(season=season, week=week),
+                projected_data.assign(season=season, week=week))
     
     def collect_weekly_data(self, position: str = "RB", seasons: List[int] = None, 
                            weeks: List[int] = None) -> pd.DataFrame:
@@ -159,35 +467,112 @@ class NFLDataIntegrator:
         if weeks is None:
             weeks = list(range(1, 19))  # Weeks 1-18
         
-        all_data = []
+        result = self._collect_positions_weekly_data([position], seasons, weeks)[position]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def _collect_positions_weekly_data(self, positions: List[str], seasons: List[int],
+                                       weeks: List[int]) -> Dict[str, object]:
+        """
+        Collect weekly data for several positions, with every file read in one pool.
         
-        for season in seasons:
-            for week in weeks:
+        Args:
+            positions: Player positions
+            seasons: List of seasons to collect
+            weeks: List of weeks to collect
+            
+        Returns:
+            Dictionary of position to its combined DataFrame, or to the
+            exception that stopped its collection
+        """
+        # One scan per season tells which weeks exist, so weeks that have not
+        # been played yet are skipped without a failed open per file
+        available_weeks = {season: self._week_directories(season) for season in seasons}
+        
+        results = {}
+        cache_files = {}
+        tasks = []
+        for position in positions:
+            # The result is deterministic given the request and the source files
+            cache_file = self._weekly_cache_path(position, seasons, weeks, available_weeks)
+            if cache_file.exists():
                 try:
-                    # Load weekly data
-                    actual_data, projected_data = self.load_weekly_data(position, season, week)
-                    
-                    # Merge data
-                    merged_data = self.merge_weekly_data(actual_data, projected_data, season, week)
-                    
-                    # Calculate fantasy points
-                    merged_data = self.calculate_fantasy_points(merged_data)
-                    
-                    all_data.append(merged_data)
-                    
+                    results[position] = pd.read_parquet(cache_file)
+                    continue
+                except (ImportError, OSError, ValueError):
+                    pass
+            
+            cache_files[position] = cache_file
+            for season in seasons:
+                for week in weeks:
+                    if week in available_weeks[season]:
+                        tasks.append((position, season, week))
+                    else:
+                        logger.warning("Could not load data for %s Week %s: week directory not found: %s",
+                                       season, week, self.nfl_data_path / str(season) / str(week))
+        
+        frames = {position: ([], []) for position in cache_files}
+        errors = {}
+        
+        # Each (position, season, week) is an independent read; pandas releases
+        # the GIL while parsing CSVs, so the reads overlap across threads. A
+        # single bounded pool keeps the thread count fixed however many
+        # positions are requested
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, max(len(tasks), 1))) as executor:
+            futures = [executor.submit(self._load_tagged_week, *task) for task in tasks]
+            
+            # Collect in submission order so each position's rows stay season/week sorted
+            for (position, season, week), future in zip(tasks, futures):
+                try:
+                    actual_data, projected_data = future.result()
                 except FileNotFoundError as e:
-                    print(f"Warning: Could not load data for {season} Week {week}: {e}")
+                    logger.warning("Could not load data for %s Week %s: %s", season, week, e)
                     continue
+                except Exception as e:
+                    errors.setdefault(position, e)
+                    continue
+                frames[position][0].append(actual_data)
+                frames[position][1].append(projected_data)
+        
+        for position, cache_file in cache_files.items():
+            actual_frames, projected_frames = frames[position]
+            if position in errors:
+                results[position] = errors[position]
+            elif not actual_frames:
+                results[position] = ValueError("No data could be loaded")
+            else:
+                results[position] = self._combine_weekly_frames(actual_frames, projected_frames, cache_file)
+        
+        return results
+    
+    def _combine_weekly_frames(self, actual_frames: List[pd.DataFrame], projected_frames: List[pd.DataFrame],
+                               cache_file: Path) -> pd.DataFrame:
+        """
+        Join loaded weeks of one position into its scored, cached weekly frame.
         
-        if not all_data:
-            raise ValueError("No data could be loaded")
+        Args:
+            actual_frames: Tagged actual data per week, in season/week order
+            projected_frames: Tagged projected data per week, in the same order
+            cache_file: Parquet path the combined frame is cached at
+            
+        Returns:
+            DataFrame with all weekly data
+        """
+        # Stack every week, then join actual to projected in a single merge
+        actual_data = pd.concat(_harmonize_dtypes(actual_frames), ignore_index=True, sort=False)
+        projected_data = pd.concat(_harmonize_dtypes(projected_frames), ignore_index=True, sort=False)
+        merged = _merge_actual_projected(actual_data, projected_data, on=['season', 'week'])
         
-        # Combine all data
-        combined_data = pd.concat(all_data, ignore_index=True)
+        # Keep the per-week layout: stats first, then season and week
+        stat_columns = [col for col in merged.columns if col not in ('season', 'week')]
+        combined_data = merged[stat_columns + ['season', 'week']].rename(columns=_COLUMN_MAPPING)
         
-        # Clean up column names
-        combined_data = self.clean_column_names(combined_data)
+        # Score every week in one pass over the combined columns
+        combined_data = combined_data.assign(**_performance_columns(combined_data))
+        combined_data = _categorize_labels(combined_data)
         
+        _write_parquet_cache(combined_data, cache_file)
         return combined_data
     
     def collect_offensive_positions_data(self, positions: List[str] = None, 
@@ -219,23 +604,26 @@ class NFLDataIntegrator:
         
         all_data = []
         
+        # Every position's weeks are read through one shared pool
+        position_results = self._collect_positions_weekly_data(offensive_positions, seasons, weeks)
         for position in offensive_positions:
             print(f"Collecting data for {position}...")
-            try:
-                position_data = self.collect_weekly_data(position, seasons, weeks)
-                all_data.append(position_data)
-                print(f"✅ Collected {len(position_data)} records for {position}")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not collect data for {position}: {e}")
+            position_data = position_results[position]
+            if isinstance(position_data, Exception):
+                print(f"⚠️  Warning: Could not collect data for {position}: {position_data}")
                 continue
+            all_data.append(position_data)
+            print(f"✅ Collected {len(position_data)} records for {position}")
         
         if not all_data:
             raise ValueError("No offensive position data could be loaded")
         
-        # Combine all offensive position data
-        combined_data = pd.concat(all_data, ignore_index=True)
+        # Combine all offensive position data; positions carry different stat
+        # columns, so align dtypes first to keep shared columns numeric
+        combined_data = pd.concat(_harmonize_dtypes(all_data), ignore_index=True, sort=False)
         
-        # Clean up column names
+        # Clean up column names; concatenating positions with different
+        # categories falls back to strings, and this re-categorizes the labels
         combined_data = self.clean_column_names(combined_data)
         
         print(f"✅ Total offensive position records: {len(combined_data)}")
@@ -282,33 +670,12 @@ class NFLDataIntegrator:
             df: DataFrame to clean
             
         Returns:
-            DataFrame with cleaned column names
-        """
-        df = df.copy()
-        
-        # Rename columns to match our expected format
-        column_mapping = {
-            'PlayerName': 'player_name',
-            'PlayerId': 'player_id',
-            'Pos': 'position',
-            'Team': 'team',
-            'PlayerOpponent': 'opponent',
-            'RushingYDS': 'rushing_yards',
-            'RushingTD': 'rushing_touchdowns',
-            'ReceivingRec': 'receptions',
-            'ReceivingYDS': 'receiving_yards',
-            'ReceivingTD': 'receiving_touchdowns',
-            'Fum': 'fumbles_lost',
-            'TouchCarries': 'carries',
-            'Targets': 'targets',
-            'TotalPoints': 'total_points'
-        }
-        
-        # Apply mapping for columns that exist
-        existing_cols = {k: v for k, v in column_mapping.items() if k in df.columns}
-        df = df.rename(columns=existing_cols)
-        
-        return df
+            DataFrame with cleaned column names and categorical label columns
+        """
+        # Rename columns to match our expected format; rename returns a new
+        # frame, so no defensive copy is needed
+        existing_cols = {k: _COLUMN_MAPPING[k] for k in _COLUMN_MAPPING_KEYS.intersection(df.columns)}
+        return _categorize_labels(df.rename(columns=existing_cols))
     
     def save_integrated_data(self, df: pd.DataFrame, position: str = "RB", 
                            filename: str = None) -> Path:
@@ -318,7 +685,7 @@ class NFLDataIntegrator:
         Args:
             df: DataFrame to save
             position: Player position
-            filename: Optional filename
+            filename: Optional filename; a .parquet name writes Parquet instead of CSV
             
         Returns:
             Path to saved file
@@ -327,7 +694,11 @@ class NFLDataIntegrator:
             filename = f"nfl_{position.lower()}_data.csv"
         
         output_path = self.paths['processed_data'] / filename
-        df.to_csv(output_path, index=False)
+        # Parquet keeps dtypes and is smaller and faster to reload; CSV stays the default
+        if output_path.suffix == '.parquet':
+            df.to_parquet(output_path, compression='zstd', index=False)
+        else:
+            write_csv(df, output_path)
         
         print(f"Integrated NFL data saved to: {output_path}")
         print(f"Data shape: {df.shape}")
@@ -337,6 +708,22 @@ class NFLDataIntegrator:
         
         return output_path
     
+    @staticmethod
+    def _stat_mtime_ns(path: Path) -> Optional[int]:
+        """
+        Get a path's modification time, or None if it no longer exists.
+        
+        Args:
+            path: Path to check
+            
+        Returns:
+            Modification time in nanoseconds, or None
+        """
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
     def get_available_data(self) -> Dict[str, List[int]]:
         """
         Get information about available data.
@@ -344,19 +731,35 @@ class NFLDataIntegrator:
         Returns:
             Dictionary with available seasons and positions
         """
-        available_data = {}
-        
-        for season_dir in self.nfl_data_path.iterdir():
-            if season_dir.is_dir() and season_dir.name.isdigit():
-                season = int(season_dir.name)
-                available_data[season] = []
-                
-                # Check what positions are available
-                for file in season_dir.glob("*_season.csv"):
-                    position = file.stem.replace("_season", "")
-                    available_data[season].append(position)
+        # Rescan only when a season directory has been added or removed, or
+        # a file has been added to or removed from one; one stat per season
+        dir_mtime_ns = self.nfl_data_path.stat().st_mtime_ns
+        if self._available_data is not None and self._available_data[0] == dir_mtime_ns:
+            _, season_mtimes, available_data = self._available_data
+            if all(self._stat_mtime_ns(self.nfl_data_path / str(season)) == mtime_ns
+                   for season, mtime_ns in season_mtimes.items()):
+                return {season: list(positions) for season, positions in available_data.items()}
         
-        return available_data
+        available_data = {}
+        season_mtimes = {}
+        
+        # scandir entries carry their file type, so no per-entry stat is needed
+        with os.scandir(self.nfl_data_path) as season_entries:
+            for season_dir in season_entries:
+                if season_dir.name.isdigit() and season_dir.is_dir():
+                    season = int(season_dir.name)
+                    season_mtimes[season] = season_dir.stat().st_mtime_ns
+                    
+                    # Check what positions are available
+                    with os.scandir(season_dir.path) as files:
+                        available_data[season] = [
+                            file.name[:-len("_season.csv")]
+                            for file in files
+                            if file.name.endswith("_season.csv") and file.is_file()
+                        ]
+        
+        self._available_data = (dir_mtime_ns, season_mtimes, available_data)
+        return {season: list(positions) for season, positions in available_data.items()}
 
 
 def download_nfl_data():
@@ -368,18 +771,32 @@ def download_nfl_data():
         return True
     
     print("📥 Downloading NFL-Data repository...")
+    
+    # Extract next to the target and rename at the end, so an interrupted
+    # download never looks like a complete repository
+    partial_path = nfl_data_path.with_name(f"{nfl_data_path.name}.partial")
+    shutil.rmtree(partial_path, ignore_errors=True)
+    
     try:
-        subprocess.run([
-            "git", "clone", "https://github.com/hvpkod/NFL-Data.git"
-        ], check=True)
+        # Stream the tarball straight from the response into the extractor
+        with urllib.request.urlopen(NFL_DATA_ARCHIVE_URL) as response, \
+                tarfile.open(fileobj=response, mode="r|gz") as archive:
+            if hasattr(tarfile, "data_filter"):
+                archive.extraction_filter = tarfile.data_filter
+            
+            for member in archive:
+                # Drop the archive's top-level "NFL-Data-<ref>/" directory
+                member.name = member.name.partition("/")[2]
+                if member.name:
+                    archive.extract(member, partial_path)
+        
+        partial_path.rename(nfl_data_path)
         print("✅ NFL-Data repository downloaded successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except (OSError, tarfile.TarError) as e:
+        shutil.rmtree(partial_path, ignore_errors=True)
         print(f"❌ Error downloading NFL-Data: {e}")
         return False
-    except FileNotFoundError:
-        print("❌ Git not found. Please install Git and try again.")
-        return False
 
 
 def explore_data():
@@ -423,6 +840,7 @@ def main():
                        help="Test data integration")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     
     if args.download:
         download_nfl_data()
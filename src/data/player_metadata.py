@@ -3,6 +3,8 @@ Player Metadata Integration Module
 Integrates player age and experience data with NFL performance data.
 """
 
+import hashlib
+import os
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -11,6 +13,10 @@ import warnings
 
 from ..utils.config import load_config, get_data_paths
 
+# Part of the cleaned-metadata cache file name; bump it whenever a change to the
+# cleaning code alters the cleaned frame, so older copies are not served
+_METADATA_CACHE_VERSION = 1
+
 
 class PlayerMetadataIntegrator:
     """
@@ -33,6 +39,7 @@ class PlayerMetadataIntegrator:
         
         # Load and preprocess metadata
         self.metadata_df = self._load_metadata()
+        self._name_index = self._build_name_index(self.metadata_df['Player'].unique())
     
     def _load_metadata(self) -> pd.DataFrame:
         """
@@ -43,9 +50,74 @@ class PlayerMetadataIntegrator:
         """
         print("📊 Loading player metadata...")
         
-        # Load the CSV file
-        df = pd.read_csv(self.metadata_path)
+        parquet_path = self._ensure_parquet()
+        if parquet_path is not None:
+            df = pd.read_parquet(parquet_path)
+        else:
+            df = self._clean_metadata(self._read_metadata_csv())
+        
+        print(f"✅ Loaded {len(df)} player records with age data")
+        print(f"Positions: {df['Pos'].unique()}")
+        print(f"Seasons: {sorted(df['Season'].unique())}")
+        
+        return df
+    
+    def _ensure_parquet(self) -> Optional[Path]:
+        """
+        Keep a cleaned Parquet copy of the metadata CSV under the processed data directory.
         
+        The copy's name carries _METADATA_CACHE_VERSION and the CSV's path and
+        mtime, so it is rebuilt whenever the CSV or the cleaning code changes.
+        
+        Returns:
+            Path to the Parquet copy, or None if it could not be written
+        """
+        path_digest = hashlib.blake2b(str(self.metadata_path.resolve()).encode(), digest_size=8).hexdigest()
+        cache_prefix = f"player_metadata.v{_METADATA_CACHE_VERSION}.{path_digest}"
+        cache_dir = self.paths['processed_data'] / 'metadata_cache'
+        parquet_path = cache_dir / f"{cache_prefix}.{self.metadata_path.stat().st_mtime_ns}.parquet"
+        if parquet_path.exists():
+            return parquet_path
+        
+        df = self._clean_metadata(self._read_metadata_csv())
+        tmp_path = parquet_path.with_name(f"{parquet_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+            os.replace(tmp_path, parquet_path)
+        except (ImportError, OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+            return None
+        
+        # Copies of earlier versions of the CSV are never read again
+        for stale_path in cache_dir.glob(f"{cache_prefix}.*.parquet"):
+            if stale_path != parquet_path:
+                stale_path.unlink(missing_ok=True)
+        
+        return parquet_path
+    
+    def _read_metadata_csv(self) -> pd.DataFrame:
+        """
+        Parse the raw metadata CSV with PyArrow's multithreaded reader if available.
+        
+        Returns:
+            Raw metadata DataFrame
+        """
+        try:
+            return pd.read_csv(self.metadata_path, engine='pyarrow')
+        except ImportError:
+            return pd.read_csv(self.metadata_path)
+    
+    def _clean_metadata(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean raw player metadata as read from the CSV.
+        
+        Args:
+            df: Raw metadata DataFrame
+            
+        Returns:
+            DataFrame with cleaned player metadata
+        """
         # Clean column names
         df.columns = df.columns.str.strip()
         
@@ -70,10 +142,6 @@ class PlayerMetadataIntegrator:
         # Standardize team names to match our NFL data
         df['team_clean'] = self._standardize_team_names(df['Tm'])
         
-        print(f"✅ Loaded {len(df)} player records with age data")
-        print(f"Positions: {df['Pos'].unique()}")
-        print(f"Seasons: {sorted(df['Season'].unique())}")
-        
         return df
     
     def _standardize_team_names(self, team_series: pd.Series) -> pd.Series:
@@ -97,27 +165,51 @@ class PlayerMetadataIntegrator:
             'TEN': 'TEN', 'WAS': 'WAS'
         }
         
-        return team_series.map(team_mapping).fillna(team_series)
+        # Remap the few distinct codes once and broadcast through the
+        # categorical codes; several codes can map to the same team (OAK -> LV)
+        teams = team_series.astype('category')
+        old_teams = teams.cat.categories
+        new_teams = pd.Index([team_mapping.get(team, team) for team in old_teams])
+        categories = new_teams.unique()
+        lookup = np.append(categories.get_indexer(new_teams), -1)
+        
+        return pd.Series(
+            pd.Categorical.from_codes(lookup[teams.cat.codes.to_numpy()], categories=categories),
+            index=team_series.index,
+            name=team_series.name
+        )
     
-    def _fuzzy_match_player_names(self, player_name: str, candidate_names: List[str]) -> Optional[str]:
+    @staticmethod
+    def _build_name_index(candidate_names: List[str]) -> Dict[str, str]:
         """
-        Fuzzy match player names to handle slight differences in naming.
+        Map each candidate's lowercased, stripped name to the candidate.
         
         Args:
-            player_name: Name to match
             candidate_names: List of candidate names
             
+        Returns:
+            Dictionary of normalized name to the first candidate with that name
+        """
+        name_index = {}
+        for candidate in candidate_names:
+            name_index.setdefault(candidate.lower().strip(), candidate)
+        return name_index
+    
+    @staticmethod
+    def _match_player_name(player_name: str, name_index: Dict[str, str]) -> Optional[str]:
+        """
+        Look up a player name and its common variations in a name index.
+        
+        Args:
+            player_name: Name to match
+            name_index: Output of _build_name_index
+            
         Returns:
             Best matching name or None
         """
         player_name_clean = player_name.lower().strip()
         
-        # Direct match
-        for candidate in candidate_names:
-            if candidate.lower().strip() == player_name_clean:
-                return candidate
-        
-        # Handle common variations
+        # Direct match first, then common variations
         variations = [
             player_name_clean,
             player_name_clean.replace("'", ""),
@@ -127,9 +219,9 @@ class PlayerMetadataIntegrator:
         ]
         
         for variation in variations:
-            for candidate in candidate_names:
-                if candidate.lower().strip() == variation:
-                    return candidate
+            candidate = name_index.get(variation)
+            if candidate is not None:
+                return candidate
         
         return None
     
@@ -145,75 +237,51 @@ class PlayerMetadataIntegrator:
         """
         print("🔗 Adding player age and experience data...")
         
-        # Create a copy to avoid modifying original
-        result_df = nfl_data.copy()
-        
-        # Initialize new columns
-        result_df['player_age'] = np.nan
-        result_df['games_played'] = np.nan
-        result_df['games_started'] = np.nan
-        
         # Get unique players from NFL data
-        nfl_players = result_df['player_name'].unique()
+        player_codes, nfl_players = pd.factorize(nfl_data['player_name'])
         metadata_players = self.metadata_df['Player'].unique()
         
         print(f"📊 Matching {len(nfl_players)} NFL players with {len(metadata_players)} metadata players...")
         
-        # Track matches for reporting
-        matches = 0
-        no_matches = []
+        # Resolve each distinct NFL name once against the prebuilt index, then
+        # broadcast to its rows
+        matched_names = np.array(
+            [self._match_player_name(nfl_player, self._name_index) for nfl_player in nfl_players],
+            dtype=object
+        )
+        is_matched = np.array([name is not None for name in matched_names], dtype=bool)
+        matches = int(is_matched.sum())
+        no_matches = [nfl_player for nfl_player, ok in zip(nfl_players, is_matched) if not ok]
+        
+        # One record per (player, season); the first record wins, as the same
+        # player-season can appear more than once in the metadata
+        metadata_cols = ['Player', 'Season', 'Age', 'games_played', 'games_started']
+        season_metadata = self.metadata_df[metadata_cols].drop_duplicates(['Player', 'Season'])
+        latest_metadata = season_metadata.loc[season_metadata.groupby('Player')['Season'].idxmax()]
+        
+        row_players = pd.DataFrame({
+            # Code -1 (missing name) picks the trailing None
+            'Player': np.append(matched_names, None)[player_codes],
+            'Season': nfl_data['season'].to_numpy()
+        })
         
-        for nfl_player in nfl_players:
-            # Try to find matching player in metadata
-            matched_player = self._fuzzy_match_player_names(nfl_player, metadata_players)
-            
-            if matched_player:
-                # Get metadata for this player (all seasons)
-                player_metadata = self.metadata_df[
-                    (self.metadata_df['Player'] == matched_player)
-                ]
-                
-                if not player_metadata.empty:
-                    # For each season, get the age and experience data
-                    for season in result_df['season'].unique():
-                        season_metadata = player_metadata[player_metadata['Season'] == season]
-                        
-                        if not season_metadata.empty:
-                            # Use the first record for that season (should be the same)
-                            age = season_metadata.iloc[0]['Age']
-                            games_played = season_metadata.iloc[0]['games_played']
-                            games_started = season_metadata.iloc[0]['games_started']
-                            
-                            # Update all rows for this player and season
-                            mask = (result_df['player_name'] == nfl_player) & (result_df['season'] == season)
-                            result_df.loc[mask, 'player_age'] = age
-                            result_df.loc[mask, 'games_played'] = games_played
-                            result_df.loc[mask, 'games_started'] = games_started
-                        else:
-                            # If no data for this season, try to estimate age from previous seasons
-                            # Find the most recent season with data for this player
-                            available_seasons = player_metadata['Season'].unique()
-                            if len(available_seasons) > 0:
-                                latest_season = max(available_seasons)
-                                if latest_season < season:
-                                    # Estimate age by adding years difference
-                                    latest_metadata = player_metadata[player_metadata['Season'] == latest_season].iloc[0]
-                                    age_diff = season - latest_season
-                                    estimated_age = latest_metadata['Age'] + age_diff
-                                    estimated_games = latest_metadata['games_played'] + (age_diff * 16)  # Rough estimate
-                                    estimated_starts = latest_metadata['games_started'] + (age_diff * 16)  # Rough estimate
-                                    
-                                    # Update all rows for this player and season
-                                    mask = (result_df['player_name'] == nfl_player) & (result_df['season'] == season)
-                                    result_df.loc[mask, 'player_age'] = estimated_age
-                                    result_df.loc[mask, 'games_played'] = estimated_games
-                                    result_df.loc[mask, 'games_started'] = estimated_starts
-                    
-                    matches += 1
-                else:
-                    no_matches.append(nfl_player)
-            else:
-                no_matches.append(nfl_player)
+        # Exact (player, season) records
+        exact = row_players.merge(season_metadata, on=['Player', 'Season'], how='left', indicator=True)
+        has_exact = (exact['_merge'] == 'both').to_numpy()
+        
+        # Seasons after a player's latest record are estimated by adding the
+        # years since then to age, and a rough 16 games per year to experience;
+        # seasons with neither stay NaN
+        latest = row_players.merge(latest_metadata, on='Player', how='left', suffixes=('', '_latest'))
+        age_diff = (latest['Season'] - latest['Season_latest']).to_numpy(dtype=np.float64)
+        can_estimate = ~has_exact & (age_diff > 0)
+        
+        result_df = nfl_data.copy()
+        for source, target, yearly_increase in (('Age', 'player_age', 1),
+                                                ('games_played', 'games_played', 16),
+                                                ('games_started', 'games_started', 16)):
+            estimated = latest[source].to_numpy(dtype=np.float64) + age_diff * yearly_increase
+            result_df[target] = np.where(can_estimate, estimated, exact[source].to_numpy(dtype=np.float64))
         
         # Report results
         print(f"✅ Successfully matched {matches} players with age data")
@@ -241,23 +309,56 @@ class PlayerMetadataIntegrator:
         if 'player_age' not in nfl_data.columns:
             raise ValueError("Player age data not found. Run add_player_metadata() first.")
         
-        age_data = nfl_data['player_age'].dropna()
+        # Ages take only a few distinct values; one counting pass over the column
+        # is enough to derive every statistic from the (age, count) pairs
+        age_counts = nfl_data['player_age'].value_counts().sort_index()
         
-        if age_data.empty:
+        if age_counts.empty:
             return {"error": "No age data available"}
         
+        ages = age_counts.index.to_numpy(dtype=np.float64)
+        counts = age_counts.to_numpy()
+        total = counts.sum()
+        
+        mean = np.dot(ages, counts) / total
+        variance = np.dot(counts, (ages - mean) ** 2) / (total - 1) if total > 1 else np.nan
+        
+        # Median of the expanded data: average of the two middle order statistics
+        cumulative = np.cumsum(counts)
+        lower, upper = ages[np.searchsorted(cumulative, [(total - 1) // 2, total // 2], side='right')]
+        
         summary = {
-            "total_players_with_age": len(age_data.unique()),
-            "age_mean": age_data.mean(),
-            "age_median": age_data.median(),
-            "age_min": age_data.min(),
-            "age_max": age_data.max(),
-            "age_std": age_data.std(),
-            "age_distribution": age_data.value_counts().sort_index().to_dict()
+            "total_players_with_age": len(age_counts),
+            "age_mean": mean,
+            "age_median": (lower + upper) / 2,
+            "age_min": age_counts.index[0],
+            "age_max": age_counts.index[-1],
+            "age_std": np.sqrt(variance),
+            "age_distribution": age_counts.to_dict()
         }
         
         return summary
     
+    @staticmethod
+    def _bin_categories(values: np.ndarray, bins: List[float], labels: List[str]) -> pd.Categorical:
+        """
+        Bin values into labelled, right-closed intervals in a single pass.
+        
+        Equivalent to pd.cut with include_lowest=True; values outside the
+        bins or missing get no category.
+        
+        Args:
+            values: Values to bin
+            bins: Bin edges, including the outer bounds
+            labels: One label per bin
+            
+        Returns:
+            Ordered categorical of bin labels
+        """
+        codes = np.searchsorted(np.asarray(bins[1:-1]), values, side='left').astype(np.int8)
+        codes[~((values >= bins[0]) & (values <= bins[-1]))] = -1
+        return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    
     def create_age_features(self, nfl_data: pd.DataFrame) -> pd.DataFrame:
         """
         Create additional age-related features for machine learning.
@@ -273,30 +374,31 @@ class PlayerMetadataIntegrator:
         
         result_df = nfl_data.copy()
         
+        age = result_df['player_age'].to_numpy(dtype=np.float64)
+        games_played = result_df['games_played'].to_numpy(dtype=np.float64)
+        
         # Age categories
-        result_df['age_category'] = pd.cut(
-            result_df['player_age'], 
-            bins=[0, 23, 26, 29, 32, 100], 
-            labels=['Rookie', 'Young', 'Prime', 'Veteran', 'Senior'],
-            include_lowest=True
+        result_df['age_category'] = self._bin_categories(
+            age, [0, 23, 26, 29, 32, 100], ['Rookie', 'Young', 'Prime', 'Veteran', 'Senior']
         )
         
         # Experience categories
-        result_df['experience_category'] = pd.cut(
-            result_df['games_played'],
-            bins=[0, 16, 48, 96, 200, 1000],
-            labels=['Rookie', 'Early', 'Mid', 'Experienced', 'Veteran'],
-            include_lowest=True
+        result_df['experience_category'] = self._bin_categories(
+            games_played, [0, 16, 48, 96, 200, 1000], ['Rookie', 'Early', 'Mid', 'Experienced', 'Veteran']
         )
         
-        # Age-related features
-        result_df['is_rookie'] = (result_df['player_age'] <= 23).astype(int)
-        result_df['is_veteran'] = (result_df['player_age'] >= 30).astype(int)
-        result_df['is_prime_age'] = ((result_df['player_age'] >= 25) & (result_df['player_age'] <= 28)).astype(int)
+        # Age-related features (missing ages compare False)
+        result_df['is_rookie'] = (age <= 23).astype(np.int8)
+        result_df['is_veteran'] = (age >= 30).astype(np.int8)
+        result_df['is_prime_age'] = ((age >= 25) & (age <= 28)).astype(np.int8)
         
         # Experience features
-        result_df['is_experienced'] = (result_df['games_played'] >= 48).astype(int)
-        result_df['games_per_season'] = result_df['games_played'] / (result_df['season'] - 2015 + 1)  # Approximate
+        result_df['is_experienced'] = (games_played >= 48).astype(np.int8)
+        # Approximate; seasons before 2015 have no elapsed years to divide by
+        seasons_elapsed = result_df['season'].to_numpy(dtype=np.float64) - 2015 + 1
+        result_df['games_per_season'] = np.divide(
+            games_played, seasons_elapsed, out=np.zeros_like(games_played), where=seasons_elapsed > 0
+        )
         
         print(f"✅ Created {len([col for col in result_df.columns if 'age' in col or 'experience' in col or 'rookie' in col or 'veteran' in col])} age-related features")
         
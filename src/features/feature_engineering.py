@@ -3,12 +3,198 @@ Feature engineering module for fantasy football analytics.
 Creates predictive features from raw player performance data.
 """
 
+import functools
+import hashlib
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 from pathlib import Path
 
 from ..utils.config import load_config, get_feature_config, get_data_paths
+from ..utils.io import write_csv
+
+# Part of every engineered-feature cache key; bump it whenever a change to this
+# module alters engineer_all_features output, so older cache entries are not served
+_FEATURE_CACHE_VERSION = 1
+
+
+def _group_start_index(groups: np.ndarray) -> np.ndarray:
+    """
+    Get, for each row, the position of the first row of its group.
+    
+    Args:
+        groups: Group labels for rows already sorted by group
+        
+    Returns:
+        Array with the start position of each row's group
+    """
+    is_start = np.empty(len(groups), dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = groups[1:] != groups[:-1]
+    return np.maximum.accumulate(np.where(is_start, np.arange(len(groups)), 0))
+
+
+def _grouped_rolling_mean(values: np.ndarray, group_start: np.ndarray,
+                          window: int, min_periods: int) -> np.ndarray:
+    """
+    Rolling mean over the last `window` rows that never crosses a group boundary.
+    
+    Matches ``groupby(...).transform(lambda x: x.rolling(window, min_periods).mean())``
+    for rows sorted by group, using cumulative sums instead of per-group Python calls.
+    
+    Args:
+        values: Values for rows sorted by group
+        group_start: Output of _group_start_index for the same rows
+        window: Number of rows in the window
+        min_periods: Minimum number of non-missing values required
+        
+    Returns:
+        Array of rolling means (NaN where fewer than min_periods values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    idx = np.arange(len(values))
+    valid = ~np.isnan(values)
+    
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    
+    lo = np.maximum(idx - window + 1, group_start)
+    total = csum[idx + 1] - csum[lo]
+    count = ccount[idx + 1] - ccount[lo]
+    
+    result = np.full(len(values), np.nan)
+    enough = count >= min_periods
+    result[enough] = total[enough] / count[enough]
+    return result
+
+
+def _grouped_rolling_mean_std(values: np.ndarray, group_start: np.ndarray,
+                              window: int, std_min_periods: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample standard deviation that never cross a group boundary.
+    
+    Matches ``rolling(window, min_periods=1).mean()`` and
+    ``rolling(window, min_periods=std_min_periods).std()`` per group for rows
+    sorted by group. Each window is summed one lag at a time, so no rounding error
+    carries over from earlier rows, and the deviations are taken around the
+    window mean rather than via E[x^2] - E[x]^2. Windows whose values are all
+    equal give a deviation of exactly 0, as in pandas.
+    
+    Args:
+        values: Values for rows sorted by group
+        group_start: Output of _group_start_index for the same rows
+        window: Number of rows in the window
+        std_min_periods: Minimum number of non-missing values for a deviation
+        
+    Returns:
+        Tuple of rolling means and standard deviations (NaN where too few values)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    lagged = [_grouped_shift(values, group_start, lag) for lag in range(window)]
+    
+    total = np.zeros(len(values))
+    count = np.zeros(len(values), dtype=np.int64)
+    for lag_values in lagged:
+        valid = ~np.isnan(lag_values)
+        total += np.where(valid, lag_values, 0.0)
+        count += valid
+    
+    mean = np.full(len(values), np.nan)
+    has_values = count >= 1
+    mean[has_values] = total[has_values] / count[has_values]
+    
+    squared = np.zeros(len(values))
+    for lag_values in lagged:
+        squared += np.where(np.isnan(lag_values), 0.0, (lag_values - mean) ** 2)
+    
+    std = np.full(len(values), np.nan)
+    enough = count >= max(std_min_periods, 2)
+    std[enough] = np.sqrt(squared[enough] / (count[enough] - 1))
+    std[enough & (np.fmin.reduce(lagged) == np.fmax.reduce(lagged))] = 0.0
+    return mean, std
+
+
+def _grouped_shift(values: np.ndarray, group_start: np.ndarray, periods: int) -> np.ndarray:
+    """
+    Shift values down by `periods` rows within each group.
+    
+    Args:
+        values: Values for rows sorted by group
+        group_start: Output of _group_start_index for the same rows
+        periods: Number of rows to shift
+        
+    Returns:
+        Shifted array with NaN where the source row is in another group
+    """
+    idx = np.arange(len(values))
+    src = idx - periods
+    result = np.full(len(values), np.nan)
+    ok = src >= group_start
+    result[ok] = values[src[ok]]
+    return result
+
+
+def _frame_digest(df: pd.DataFrame, *extra: str) -> str:
+    """
+    Hash a DataFrame's contents, columns and dtypes into a short hex key.
+    
+    Args:
+        df: DataFrame to hash
+        extra: Additional strings that should change the key (e.g. config)
+        
+    Returns:
+        Hex digest identifying the frame
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{_FEATURE_CACHE_VERSION}".encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(repr(list(zip(df.columns, df.dtypes.astype(str)))).encode())
+    for item in extra:
+        digest.update(item.encode())
+    return digest.hexdigest()
+
+
+def _parquet_memoized(method: Callable) -> Callable:
+    """
+    Cache a FeatureEngineer method's output on disk, keyed by its input frame.
+    
+    Results are stored as zstd-compressed Parquet under the processed data
+    directory. Caching is opt-in through the ``features.cache_engineered_features``
+    config flag, and is skipped when the input cannot be hashed or Parquet
+    support is unavailable.
+    
+    Args:
+        method: Method taking and returning a DataFrame
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self, df: pd.DataFrame) -> pd.DataFrame:
+        if not self.feature_config.get('cache_engineered_features', False):
+            return method(self, df)
+        
+        try:
+            key = _frame_digest(df, method.__name__, repr(self.feature_config))
+        except TypeError:
+            return method(self, df)
+        
+        cache_path = self.paths['processed_data'] / 'feature_cache' / f"engineered_{key}.parquet"
+        if cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except (ImportError, OSError, ValueError):
+                pass
+        
+        result = method(self, df)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            result.to_parquet(cache_path, compression='zstd')
+        except (ImportError, OSError, TypeError, ValueError):
+            pass
+        return result
+    
+    return wrapper
 
 
 class FeatureEngineer:
@@ -27,13 +213,16 @@ class FeatureEngineer:
         self.feature_config = get_feature_config(self.config)
         self.paths = get_data_paths(self.config)
         
-    def create_rolling_features(self, df: pd.DataFrame, player_col: str = 'player_name') -> pd.DataFrame:
+    def create_rolling_features(self, df: pd.DataFrame, player_col: str = 'player_name',
+                                assume_sorted: bool = False) -> pd.DataFrame:
         """
         Create rolling average features for each player.
         
         Args:
             df: DataFrame with player performance data
             player_col: Column name for player identifier
+            assume_sorted: Skip sorting when df is already sorted by player,
+                season and week with a default index
             
         Returns:
             DataFrame with rolling features added
@@ -41,7 +230,8 @@ class FeatureEngineer:
         print("Creating rolling average features...")
         
         # Sort by player, season, week for proper rolling calculations
-        df = df.sort_values([player_col, 'season', 'week']).reset_index(drop=True)
+        if not assume_sorted:
+            df = df.sort_values([player_col, 'season', 'week']).reset_index(drop=True)
         
         # Get rolling windows from config
         rolling_windows = self.feature_config.get('rolling_windows', [3, 5])
@@ -52,30 +242,36 @@ class FeatureEngineer:
             'receiving_yards', 'receiving_touchdowns', 'fantasy_points'
         ]
         
+        present_stats = [stat for stat in stat_columns if stat in df.columns]
+        if not present_stats:
+            return df
+        
+        # Rows are sorted by player, so each window is clamped to the start of
+        # its player's block instead of grouping
+        group_start = _group_start_index(df[player_col].to_numpy())
+        
         for window in rolling_windows:
-            for stat in stat_columns:
-                if stat in df.columns:
-                    # Rolling average
-                    col_name = f'{stat}_rolling_{window}'
-                    df[col_name] = df.groupby(player_col)[stat].transform(
-                        lambda x: x.rolling(window=window, min_periods=1).mean()
-                    )
-                    
-                    # Rolling standard deviation (volatility)
-                    col_name_std = f'{stat}_rolling_{window}_std'
-                    df[col_name_std] = df.groupby(player_col)[stat].transform(
-                        lambda x: x.rolling(window=window, min_periods=2).std().fillna(0)
-                    )
+            for stat in present_stats:
+                means, stds = _grouped_rolling_mean_std(df[stat].to_numpy(dtype=np.float64), group_start, window)
+                
+                # Rolling average
+                df[f'{stat}_rolling_{window}'] = means
+                
+                # Rolling standard deviation (volatility)
+                df[f'{stat}_rolling_{window}_std'] = np.where(np.isnan(stds), 0.0, stds)
         
         return df
     
-    def create_trend_features(self, df: pd.DataFrame, player_col: str = 'player_name') -> pd.DataFrame:
+    def create_trend_features(self, df: pd.DataFrame, player_col: str = 'player_name',
+                              assume_sorted: bool = False) -> pd.DataFrame:
         """
         Create trend features showing recent performance direction.
         
         Args:
             df: DataFrame with player performance data
             player_col: Column name for player identifier
+            assume_sorted: Skip sorting when df is already sorted by player,
+                season and week with a default index
             
         Returns:
             DataFrame with trend features added
@@ -83,26 +279,27 @@ class FeatureEngineer:
         print("Creating trend features...")
         
         # Sort by player, season, week
-        df = df.sort_values([player_col, 'season', 'week']).reset_index(drop=True)
+        if not assume_sorted:
+            df = df.sort_values([player_col, 'season', 'week']).reset_index(drop=True)
         
         # Create trend features for key stats
         trend_stats = ['fantasy_points', 'rushing_yards', 'receptions']
+        group_start = _group_start_index(df[player_col].to_numpy())
         
         for stat in trend_stats:
             if stat in df.columns:
                 # Recent vs previous performance (last 3 vs previous 3)
-                df[f'{stat}_trend_3v3'] = df.groupby(player_col)[stat].transform(
-                    lambda x: x.rolling(3, min_periods=3).mean() - 
-                             x.rolling(6, min_periods=6).mean().shift(3)
-                )
+                values = df[stat].to_numpy(dtype=np.float64)
+                recent = _grouped_rolling_mean(values, group_start, 3, 3)
+                previous = _grouped_shift(_grouped_rolling_mean(values, group_start, 6, 6), group_start, 3)
+                df[f'{stat}_trend_3v3'] = recent - previous
                 
                 # Week-over-week change
-                df[f'{stat}_week_change'] = df.groupby(player_col)[stat].diff()
+                df[f'{stat}_week_change'] = values - _grouped_shift(values, group_start, 1)
                 
                 # Performance consistency (lower std = more consistent)
-                df[f'{stat}_consistency'] = df.groupby(player_col)[stat].transform(
-                    lambda x: 1 / (1 + x.rolling(5, min_periods=3).std())
-                )
+                _, std = _grouped_rolling_mean_std(values, group_start, 5, std_min_periods=3)
+                df[f'{stat}_consistency'] = 1 / (1 + std)
         
         return df
     
@@ -119,19 +316,25 @@ class FeatureEngineer:
         print("Creating projection-related features...")
         
         if 'projection' in df.columns:
+            # Plain array arithmetic below skips index alignment; every operand
+            # comes from df itself
+            projection = df['projection'].to_numpy()
+            
             # Projection accuracy in recent weeks
-            df['projection_error'] = df['fantasy_points'] - df['projection']
+            df['projection_error'] = df['fantasy_points'].to_numpy() - projection
             
-            # Rolling projection accuracy
-            df['projection_accuracy_rolling_5'] = df.groupby('player_name')['projection_error'].transform(
-                lambda x: x.rolling(5, min_periods=3).mean()
+            # Rolling projection accuracy (grouped rolling runs in Cython, no per-player lambda)
+            df['projection_accuracy_rolling_5'] = (
+                df.groupby('player_name')['projection_error']
+                .rolling(5, min_periods=3).mean()
+                .reset_index(level=0, drop=True)
             )
             
             # Projection vs recent performance
-            df['projection_vs_recent'] = df['projection'] - df['fantasy_points_rolling_3']
+            df['projection_vs_recent'] = projection - df['fantasy_points_rolling_3'].to_numpy()
             
             # Projection confidence (based on recent volatility)
-            df['projection_confidence'] = 1 / (1 + df['fantasy_points_rolling_3_std'])
+            df['projection_confidence'] = 1 / (1 + df['fantasy_points_rolling_3_std'].to_numpy())
         
         return df
     
@@ -151,18 +354,19 @@ class FeatureEngineer:
         df['season_week'] = df['week']
         
         # Late season indicator (weeks 14-18 are fantasy playoffs)
-        df['late_season'] = (df['week'] >= 14).astype(int)
+        df['late_season'] = (df['week'] >= 14).astype(np.int8)
         
         # Early season indicator (weeks 1-4)
-        df['early_season'] = (df['week'] <= 4).astype(int)
+        df['early_season'] = (df['week'] <= 4).astype(np.int8)
         
         # Bye week recovery (week after bye)
-        df['post_bye'] = 0  # Placeholder - would need bye week data
+        df['post_bye'] = np.int8(0)  # Placeholder - would need bye week data
         
         # Create dummy variables for teams
         if 'team' in df.columns:
             team_dummies = pd.get_dummies(df['team'], prefix='team')
-            df = pd.concat([df, team_dummies], axis=1)
+            # Adding the columns in place leaves the existing ones untouched
+            df[team_dummies.columns] = team_dummies
         
         return df
     
@@ -189,6 +393,7 @@ class FeatureEngineer:
         
         return df
     
+    @_parquet_memoized
     def engineer_all_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply all feature engineering steps to the dataset.
@@ -201,12 +406,13 @@ class FeatureEngineer:
         """
         print("Starting comprehensive feature engineering...")
         
-        # Make a copy to avoid modifying original
-        df_engineered = df.copy()
+        # Sort once for the per-player steps; this also copies, leaving the
+        # original unmodified
+        df_engineered = df.sort_values(['player_name', 'season', 'week']).reset_index(drop=True)
         
         # Apply feature engineering steps
-        df_engineered = self.create_rolling_features(df_engineered)
-        df_engineered = self.create_trend_features(df_engineered)
+        df_engineered = self.create_rolling_features(df_engineered, assume_sorted=True)
+        df_engineered = self.create_trend_features(df_engineered, assume_sorted=True)
         df_engineered = self.create_projection_features(df_engineered)
         df_engineered = self.create_context_features(df_engineered)
         df_engineered = self.create_target_variable(df_engineered)
@@ -259,13 +465,17 @@ class FeatureEngineer:
         
         Args:
             df: Engineered DataFrame
-            filename: Output filename
+            filename: Output filename; a .parquet name writes Parquet instead of CSV
             
         Returns:
             Path to saved file
         """
         output_path = self.paths['processed_data'] / filename
-        df.to_csv(output_path, index=False)
+        # Parquet keeps dtypes and is smaller and faster to reload; CSV stays the default
+        if output_path.suffix == '.parquet':
+            df.to_parquet(output_path, compression='zstd', index=False)
+        else:
+            write_csv(df, output_path)
         print(f"Engineered data saved to: {output_path}")
         return output_path
 
@@ -1,23 +1,33 @@
 """
 Baseline model for fantasy football analytics.
-Implements a Random Forest classifier to predict over/under performance.
+Implements a Random Forest classifier to predict over/under performance,
+with histogram gradient boosting available as a faster alternative.
 """
 
+import hashlib
+import math
+import os
+import pickle
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
-from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.base import ClassifierMixin, clone
+from sklearn.model_selection import train_test_split, cross_validate
 import joblib
+import warnings
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
 
 from ..utils.config import load_config, get_model_config, get_data_paths
 from ..features.feature_engineering import FeatureEngineer
 
+# Feature columns keyed by a frame's (column, dtype) schema, which is all
+# get_feature_columns looks at; kept in least-recently-used order
+_FEATURE_COLUMNS_CACHE: Dict[Tuple, List[str]] = {}
+
+# Most schemas kept in _FEATURE_COLUMNS_CACHE; each key holds every column name
+_FEATURE_COLUMNS_CACHE_SIZE = 8
+
 
 class BaselineModel:
     """
@@ -34,16 +44,19 @@ class BaselineModel:
         self.config = load_config(config_path)
         self.model_config = get_model_config(self.config)
         self.paths = get_data_paths(self.config)
+        # No feature scaler: tree models are invariant to monotone feature scaling
         self.model = None
-        self.scaler = StandardScaler()
         self.feature_columns = None
+        self._onnx_session = None
+        self._feature_importance = None
+        self._training_signature = None
         
     def load_data(self, data_path: str = "data/processed/engineered_rb_data.csv") -> pd.DataFrame:
         """
         Load engineered data for training.
         
         Args:
-            data_path: Path to engineered data file
+            data_path: Path to engineered data file (CSV or Parquet)
             
         Returns:
             DataFrame with engineered features
@@ -54,11 +67,56 @@ class BaselineModel:
         if not data_file.exists():
             raise FileNotFoundError(f"Data file not found: {data_path}")
         
-        df = pd.read_csv(data_file)
+        if data_file.suffix == '.parquet':
+            df = pd.read_parquet(data_file)
+        else:
+            df = self._read_csv_with_parquet_cache(data_file)
         print(f"Loaded {len(df)} records with {len(df.columns)} columns")
         
         return df
     
+    def _read_csv_with_parquet_cache(self, csv_file: Path) -> pd.DataFrame:
+        """
+        Read a CSV through a private Parquet copy keyed by the CSV's path and mtime.
+        
+        The copy lives under processed_data/.csv_cache, so it can never be
+        confused with a Parquet file saved next to the CSV.
+        
+        Args:
+            csv_file: Path to the CSV file
+            
+        Returns:
+            Parsed DataFrame
+        """
+        csv_stat = csv_file.stat()
+        path_digest = hashlib.blake2b(str(csv_file.resolve()).encode(), digest_size=8).hexdigest()
+        cache_dir = self.paths['processed_data'] / '.csv_cache'
+        cache_file = cache_dir / f"{csv_file.stem}.{path_digest}.{csv_stat.st_mtime_ns}.parquet"
+        try:
+            return pd.read_parquet(cache_file)
+        except (FileNotFoundError, ImportError, OSError, ValueError):
+            pass
+        
+        # PyArrow's reader is multithreaded and parses floats exactly
+        try:
+            df = pd.read_csv(csv_file, engine='pyarrow')
+        except ImportError:
+            return pd.read_csv(csv_file)
+        
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_file, compression='zstd', index=False)
+            os.replace(tmp_file, cache_file)
+            # Copies made from earlier versions of this CSV are never read again
+            for stale_file in cache_dir.glob(f"{csv_file.stem}.{path_digest}.*.parquet"):
+                if stale_file != cache_file:
+                    stale_file.unlink(missing_ok=True)
+        except (ImportError, OSError, TypeError, ValueError):
+            tmp_file.unlink(missing_ok=True)
+        
+        return df
+    
     def prepare_features(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Prepare features and target for training.
@@ -72,56 +130,155 @@ class BaselineModel:
         print("Preparing features and target...")
         
         # Get feature columns
-        engineer = FeatureEngineer()
-        self.feature_columns = engineer.get_feature_columns(df)
-        
-        # Select features and target
-        X = df[self.feature_columns].copy()
+        schema = tuple(df.dtypes.items())
+        feature_columns = _FEATURE_COLUMNS_CACHE.pop(schema, None)
+        if feature_columns is None:
+            feature_columns = FeatureEngineer().get_feature_columns(df)
+            if len(_FEATURE_COLUMNS_CACHE) >= _FEATURE_COLUMNS_CACHE_SIZE:
+                del _FEATURE_COLUMNS_CACHE[next(iter(_FEATURE_COLUMNS_CACHE))]
+        # Re-inserting moves the schema to the most recently used end
+        _FEATURE_COLUMNS_CACHE[schema] = feature_columns
+        self.feature_columns = list(feature_columns)
+        
+        # Select features and target; fillna returns a new frame, so the
+        # selection needs no copy of its own
+        X = df[self.feature_columns].fillna(0)  # Simple imputation for MVP
         y = df['target']
         
-        # Handle missing values
-        X = X.fillna(0)  # Simple imputation for MVP
-        
         print(f"Prepared {len(X)} samples with {len(self.feature_columns)} features")
-        print(f"Target distribution: {y.value_counts().to_dict()}")
+        # The target is a 0/1 label, so counting by value needs no sort
+        print(f"Target distribution: {dict(enumerate(np.bincount(y.to_numpy(dtype=np.int64)).tolist()))}")
         
         return X, y
     
-    def train_model(self, X: pd.DataFrame, y: pd.Series) -> RandomForestClassifier:
+    def train_model(self, X: pd.DataFrame, y: pd.Series, incremental: bool = False) -> ClassifierMixin:
         """
-        Train the Random Forest model.
+        Train the classifier selected by the model config's algorithm.
         
         Args:
             X: Feature matrix
             y: Target variable
+            incremental: Grow the current forest instead of rebuilding it when
+                only n_estimators has increased and X and y are the data of
+                the last incremental fit, e.g. in an n_estimators sweep
             
         Returns:
-            Trained Random Forest model
+            Trained Random Forest or histogram gradient boosting model
         """
-        print("Training Random Forest model...")
-        
-        # Get model parameters from config
-        rf_params = self.model_config.get('random_forest', {})
+        algorithm = self.model_config.get('algorithm', 'RandomForestClassifier')
+        training_signature = None
+        random_state = self.model_config.get('random_state', 42)
         
-        # Create and train model
-        self.model = RandomForestClassifier(
-            n_estimators=rf_params.get('n_estimators', 100),
-            max_depth=rf_params.get('max_depth', 10),
-            min_samples_split=rf_params.get('min_samples_split', 5),
-            min_samples_leaf=rf_params.get('min_samples_leaf', 2),
-            random_state=self.model_config.get('random_state', 42),
-            n_jobs=-1
-        )
+        if algorithm == 'RandomForestClassifier':
+            print("Training Random Forest model...")
+            
+            # Get model parameters from config
+            rf_params = self.model_config.get('random_forest', {})
+            
+            # Optional cap on leaves per tree; 'auto' scales it with the
+            # training set so saved trees stay small
+            max_leaf_nodes = rf_params.get('max_leaf_nodes')
+            if max_leaf_nodes == 'auto':
+                max_leaf_nodes = max(32, int(math.sqrt(len(X))))
+            
+            # Create and train model
+            forest = RandomForestClassifier(
+                n_estimators=rf_params.get('n_estimators', 100),
+                max_depth=rf_params.get('max_depth', 10),
+                min_samples_split=rf_params.get('min_samples_split', 5),
+                min_samples_leaf=rf_params.get('min_samples_leaf', 2),
+                max_leaf_nodes=max_leaf_nodes,
+                random_state=random_state,
+                n_jobs=-1
+            )
+            
+            # With warm_start, fit only builds the trees beyond those already
+            # in the ensemble; the data is only hashed when a grow is requested
+            if incremental:
+                training_signature = self._get_training_signature(X, y)
+            if incremental and self._can_grow_forest(forest, training_signature):
+                self.model.set_params(n_estimators=forest.n_estimators, warm_start=True)
+            else:
+                if incremental and isinstance(self.model, RandomForestClassifier):
+                    print("Cannot grow the current forest; building a new one")
+                self.model = forest
+        elif algorithm == 'HistGradientBoostingClassifier':
+            print("Training Histogram Gradient Boosting model...")
+            
+            # Features are binned once into at most 255 buckets, so each split
+            # scans a histogram instead of sorted feature values
+            hgb_params = self.model_config.get('hist_gradient_boosting', {})
+            self.model = HistGradientBoostingClassifier(
+                max_iter=hgb_params.get('max_iter', 100),
+                learning_rate=hgb_params.get('learning_rate', 0.1),
+                max_depth=hgb_params.get('max_depth'),
+                early_stopping=hgb_params.get('early_stopping', 'auto'),
+                random_state=random_state
+            )
+        else:
+            raise ValueError(f"Unsupported model algorithm: {algorithm}")
         
         # Train the model
         self.model.fit(X, y)
+        self._feature_importance = None
+        self._training_signature = training_signature
         
         print("Model training complete!")
+        if isinstance(self.model, RandomForestClassifier):
+            print(f"Terminal nodes: {sum(tree.tree_.n_leaves for tree in self.model.estimators_)}")
         print(f"Model parameters: {self.model.get_params()}")
         
         return self.model
     
-    def evaluate_model(self, X: pd.DataFrame, y: pd.Series, X_test: pd.DataFrame = None, y_test: pd.Series = None) -> Dict[str, float]:
+    @staticmethod
+    def _get_training_signature(X: pd.DataFrame, y: pd.Series) -> Tuple[Tuple[int, ...], str]:
+        """
+        Identify a training set by its shape and a digest of its values.
+        
+        Rows are hashed by value with pandas' hashing, so equal frames match
+        whatever their column dtypes and memory layout.
+        
+        Args:
+            X: Feature matrix
+            y: Target variable
+            
+        Returns:
+            Tuple of (X shape, hex digest of X's columns and values and of y)
+        """
+        X = pd.DataFrame(X)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(list(zip(X.columns, X.dtypes.astype(str)))).encode())
+        digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+        digest.update(pd.util.hash_pandas_object(pd.Series(y), index=False).to_numpy().tobytes())
+        return X.shape, digest.hexdigest()
+    
+    def _can_grow_forest(self, forest: RandomForestClassifier,
+                         training_signature: Tuple[Tuple[int, ...], str]) -> bool:
+        """
+        Check whether the current forest can be grown into the requested one.
+        
+        Args:
+            forest: Unfitted forest with the requested parameters
+            training_signature: _get_training_signature of the data to fit
+            
+        Returns:
+            True if the current forest is fitted on the same data, has fewer
+            trees, and matches every other parameter
+        """
+        if not isinstance(self.model, RandomForestClassifier) or not hasattr(self.model, 'estimators_'):
+            return False
+        
+        # Trees fit on other data must not be mixed into the ensemble
+        if training_signature != self._training_signature:
+            return False
+        
+        ignored = ('n_estimators', 'warm_start')
+        current = {k: v for k, v in self.model.get_params().items() if k not in ignored}
+        requested = {k: v for k, v in forest.get_params().items() if k not in ignored}
+        return current == requested and forest.n_estimators > len(self.model.estimators_)
+    
+    def evaluate_model(self, X: pd.DataFrame, y: pd.Series, X_test: pd.DataFrame = None, y_test: pd.Series = None,
+                       verbose: bool = True) -> Dict[str, float]:
         """
         Evaluate model performance using cross-validation and test set.
         
@@ -130,15 +287,24 @@ class BaselineModel:
             y: Training target
             X_test: Test features (optional)
             y_test: Test target (optional)
+            verbose: Print the per-class classification report
             
         Returns:
             Dictionary of evaluation metrics
         """
+        # Deferred so loading a model for prediction does not import them
+        from sklearn.metrics import classification_report, roc_auc_score
+        
         print("Evaluating model performance...")
         
         # Cross-validation
         cv_folds = self.config.get('evaluation', {}).get('cross_validation_folds', 5)
-        cv_scores = cross_val_score(self.model, X, y, cv=cv_folds, scoring='accuracy')
+        # Folds run in parallel, each forest on a single core; joblib's
+        # per-tree dispatch costs more than it saves on forests this small
+        cv_estimator = clone(self.model)
+        if 'n_jobs' in cv_estimator.get_params():
+            cv_estimator.set_params(n_jobs=1)
+        cv_scores = cross_validate(cv_estimator, X, y, cv=cv_folds, scoring='accuracy', n_jobs=-1)['test_score']
         
         print(f"Cross-validation accuracy: {cv_scores.mean():.3f} (+/- {cv_scores.std() * 2:.3f})")
         
@@ -150,41 +316,46 @@ class BaselineModel:
         }
         
         if X_test is not None and y_test is not None:
-            # Make predictions on test set
-            y_pred = self.model.predict(X_test)
-            y_pred_proba = self.model.predict_proba(X_test)[:, 1]
+            # Make predictions on test set; one pass over the trees gives both,
+            # as predict() is the argmax of the class probabilities
+            class_probabilities = self.model.predict_proba(X_test)
+            y_pred = self.model.classes_[class_probabilities.argmax(axis=1)]
+            y_pred_proba = class_probabilities[:, 1]
             
             # Calculate metrics
-            test_accuracy = (y_pred == y_test).mean()
+            test_accuracy = np.equal(y_pred, y_test.to_numpy()).mean()
             test_auc = roc_auc_score(y_test, y_pred_proba)
             
             print(f"Test set accuracy: {test_accuracy:.3f}")
             print(f"Test set AUC: {test_auc:.3f}")
             
             # Classification report
-            print("\nClassification Report:")
-            print(classification_report(y_test, y_pred))
+            if verbose:
+                print("\nClassification Report:")
+                print(classification_report(y_test, y_pred))
             
-            # Confusion matrix
-            cm = confusion_matrix(y_test, y_pred)
+            # Confusion matrix; the 0/1 target indexes the 2x2 cells directly
+            cm = np.bincount(2 * y_test.to_numpy() + y_pred, minlength=4).reshape(2, 2)
             print("\nConfusion Matrix:")
             print(cm)
             
             results.update({
                 'test_accuracy': test_accuracy,
                 'test_auc': test_auc,
-                'test_predictions': y_pred.tolist(),
-                'test_probabilities': y_pred_proba.tolist()
+                # Kept as arrays; converting to lists boxes every element
+                'test_predictions': y_pred,
+                'test_probabilities': y_pred_proba
             })
         
         return results
     
-    def feature_importance_analysis(self, X: pd.DataFrame) -> pd.DataFrame:
+    def feature_importance_analysis(self, X: pd.DataFrame, y: pd.Series = None) -> pd.DataFrame:
         """
         Analyze and display feature importance.
         
         Args:
             X: Feature matrix
+            y: Target variable; needed for models without built-in importances
             
         Returns:
             DataFrame with feature importance scores
@@ -194,12 +365,26 @@ class BaselineModel:
         if self.model is None:
             raise ValueError("Model must be trained before analyzing feature importance")
         
-        # Get feature importance
-        importance = self.model.feature_importances_
+        # Get feature importance; gradient boosting has no impurity-based
+        # importances, so fall back to permutation importance
+        importance = getattr(self.model, 'feature_importances_', None)
+        if importance is None:
+            if y is None:
+                raise ValueError("Target values are required for permutation importance")
+            from sklearn.inspection import permutation_importance
+            
+            importance = permutation_importance(
+                self.model, X, y, n_repeats=5,
+                random_state=self.model_config.get('random_state', 42)
+            ).importances_mean
+        
+        # Order once on the raw array and build the frame already sorted; ties
+        # keep feature column order and the index keeps each feature's position
+        order = np.argsort(-np.asarray(importance), kind='stable')
         feature_importance_df = pd.DataFrame({
-            'feature': self.feature_columns,
-            'importance': importance
-        }).sort_values('importance', ascending=False)
+            'feature': np.asarray(self.feature_columns, dtype=object)[order],
+            'importance': np.asarray(importance)[order]
+        }, index=order)
         
         print("\nTop 10 Most Important Features:")
         print(feature_importance_df.head(10))
@@ -219,12 +404,14 @@ class BaselineModel:
         
         # Load model
         self.model = joblib.load(model_file)
+        self._feature_importance = None
+        self._training_signature = None
         
         # Load feature columns
         feature_path = model_file.parent / "feature_columns.txt"
         if feature_path.exists():
             with open(feature_path, 'r') as f:
-                self.feature_columns = [line.strip() for line in f.readlines()]
+                self.feature_columns = f.read().splitlines()
         
         print(f"Model loaded from: {model_path}")
     
@@ -238,47 +425,122 @@ class BaselineModel:
         Returns:
             1 if predicted to over-perform, 0 otherwise
         """
+        probabilities = self.predict_proba_single_player(player_features)
+        return self.model.classes_[probabilities.argmax()]
+    
+    def predict_proba_single_player(self, player_features: pd.Series) -> np.ndarray:
+        """
+        Get prediction probabilities for a single player.
+        
+        Args:
+            player_features: Series with player features
+            
+        Returns:
+            Array with [under_perform_prob, over_perform_prob]
+        """
+        # A one-row batch, so both single-player entry points share the batch path
+        return self.predict_proba_batch(player_features.to_frame().T)[0]
+    
+    def predict_proba_batch(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Get prediction probabilities for a batch of players in one model call.
+        
+        Args:
+            df: DataFrame with one row of features per player
+            
+        Returns:
+            Array of shape (n_players, n_classes) with class probabilities
+        """
         if self.model is None:
             raise ValueError("No model loaded. Call load_model() first.")
         
         # Select only the features used by the model
         if self.feature_columns:
-            features = player_features[self.feature_columns].fillna(0)
+            features = df[self.feature_columns].fillna(0)
         else:
-            features = player_features.fillna(0)
+            features = df.fillna(0)
         
-        # Reshape for prediction
-        features_2d = features.values.reshape(1, -1)
+        # Trees compare float32 thresholds, so convert once here
+        X = features.to_numpy(dtype=np.float32)
         
-        # Make prediction
-        prediction = self.model.predict(features_2d)[0]
-        return prediction
+        if self._onnx_session is not None:
+            return self._onnx_session.run(None, {'X': X})[1]
+        
+        # Columns were selected by name above, so the positional array is safe
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='X does not have valid feature names')
+            return self.model.predict_proba(X)
     
-    def predict_proba_single_player(self, player_features: pd.Series) -> np.ndarray:
+    def enable_onnx_inference(self, model_path: str = "outputs/models/baseline_rf_model.joblib") -> bool:
         """
-        Get prediction probabilities for a single player.
+        Score through a compiled ONNX Runtime session instead of sklearn.
+        
+        The fitted forest is exported next to the joblib file, in a file named
+        after the joblib's exact modification time, so any other version of
+        the joblib (including an older one restored with its original mtime)
+        gets its own export. Requires the optional skl2onnx and onnxruntime
+        packages.
         
         Args:
-            player_features: Series with player features
+            model_path: Path to the saved joblib model file
             
         Returns:
-            Array with [under_perform_prob, over_perform_prob]
+            True if ONNX inference is enabled, False if the packages are missing
+            or the export or session could not be created
         """
         if self.model is None:
             raise ValueError("No model loaded. Call load_model() first.")
         
-        # Select only the features used by the model
-        if self.feature_columns:
-            features = player_features[self.feature_columns].fillna(0)
-        else:
-            features = player_features.fillna(0)
+        try:
+            import onnxruntime as ort
+            from skl2onnx import convert_sklearn
+            from skl2onnx.common.data_types import FloatTensorType
+        except ImportError:
+            return False
+        
+        self._onnx_session = None
+        try:
+            model_file = Path(model_path)
+            onnx_file = self._onnx_path(model_file)
+            
+            if not onnx_file.exists():
+                n_features = self.model.n_features_in_
+                # The exported TreeEnsemble stores thresholds as float32, half the
+                # size of sklearn's float64 node arrays; ai.onnx.ml tree operators
+                # have no float16 variant, so this is as compact as the forest gets
+                onnx_model = convert_sklearn(
+                    self.model,
+                    initial_types=[('X', FloatTensorType([None, n_features]))],
+                    options={id(self.model): {'zipmap': False}}
+                )
+                tmp_file = onnx_file.with_name(f"{onnx_file.name}.{os.getpid()}.tmp")
+                tmp_file.write_bytes(onnx_model.SerializeToString())
+                os.replace(tmp_file, onnx_file)
+                # Exports of other versions of this joblib are never used again
+                for stale_file in model_file.parent.glob(f"{model_file.stem}.*.onnx"):
+                    if stale_file != onnx_file:
+                        stale_file.unlink(missing_ok=True)
+            
+            self._onnx_session = ort.InferenceSession(str(onnx_file), providers=['CPUExecutionProvider'])
+        except Exception as e:
+            print(f"ONNX inference unavailable, using sklearn: {e}")
+            return False
         
-        # Reshape for prediction
-        features_2d = features.values.reshape(1, -1)
+        return True
+    
+    @staticmethod
+    def _onnx_path(model_path: Path) -> Path:
+        """
+        Get the ONNX export path for the current version of a joblib model file.
         
-        # Get probabilities
-        probabilities = self.model.predict_proba(features_2d)[0]
-        return probabilities
+        Args:
+            model_path: Path to the saved joblib model file
+            
+        Returns:
+            Path of the ONNX file, named after the joblib's mtime in nanoseconds
+        """
+        model_path = Path(model_path)
+        return model_path.with_name(f"{model_path.stem}.{model_path.stat().st_mtime_ns}.onnx")
     
     def get_feature_importance(self) -> list:
         """
@@ -290,11 +552,16 @@ class BaselineModel:
         if self.model is None:
             raise ValueError("No model loaded. Call load_model() first.")
         
-        if not hasattr(self.model, 'feature_importances_'):
+        # The forest recomputes feature_importances_ over every tree on each access
+        if self._feature_importance is not None:
+            return self._feature_importance
+        
+        importances = getattr(self.model, 'feature_importances_', None)
+        if importances is None:
             return []
         
         feature_importance = []
-        for i, importance in enumerate(self.model.feature_importances_):
+        for i, importance in enumerate(importances):
             feature_name = self.feature_columns[i] if self.feature_columns else f"feature_{i}"
             feature_importance.append({
                 "feature": feature_name,
@@ -303,6 +570,7 @@ class BaselineModel:
         
         # Sort by importance
         feature_importance.sort(key=lambda x: x['importance'], reverse=True)
+        self._feature_importance = feature_importance
         return feature_importance
     
     def save_model(self, model_name: str = "baseline_rf_model.joblib") -> Path:
@@ -324,7 +592,8 @@ class BaselineModel:
         
         # Save model
         model_path = models_dir / model_name
-        joblib.dump(self.model, model_path)
+        # Uncompressed, so loading is a straight read of the tree arrays
+        joblib.dump(self.model, model_path, protocol=pickle.HIGHEST_PROTOCOL)
         
         # Save feature columns
         feature_path = models_dir / "feature_columns.txt"
@@ -335,6 +604,15 @@ class BaselineModel:
         print(f"Model saved to: {model_path}")
         print(f"Feature columns saved to: {feature_path}")
         
+        # Compile the forest now so the first prediction does not pay for the export;
+        # the joblib model is already saved, so a failed export only loses the speedup
+        try:
+            if self.enable_onnx_inference(model_path):
+                print(f"Compiled ONNX model saved to: {self._onnx_path(model_path)}")
+        except Exception as e:
+            self._onnx_session = None
+            print(f"ONNX export failed, predictions will use sklearn: {e}")
+        
         return model_path
     
     def train_and_evaluate(self, data_path: str = "data/processed/engineered_rb_data.csv") -> Dict[str, Any]:
@@ -352,8 +630,15 @@ class BaselineModel:
         # Load data
         df = self.load_data(data_path)
         
-        # Prepare features
+        # Prepare features; only the feature matrix and target are needed
+        # from here on, so the full frame is released
         X, y = self.prepare_features(df)
+        del df
+        
+        # The forest casts every input to float32; doing it once up front
+        # halves the frame and makes the per-fit and per-predict conversions
+        # plain copies, while keeping the feature names sklearn records
+        X = X.astype(np.float32)
         
         # Split data
         test_size = self.model_config.get('test_size', 0.2)
@@ -362,6 +647,8 @@ class BaselineModel:
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=test_size, random_state=random_state, stratify=y
         )
+        # The splits are copies; drop the unsplit matrix before fitting
+        del X, y
         
         print(f"Training set: {len(X_train)} samples")
         print(f"Test set: {len(X_test)} samples")
@@ -373,7 +660,7 @@ class BaselineModel:
         results = self.evaluate_model(X_train, y_train, X_test, y_test)
         
         # Feature importance
-        feature_importance = self.feature_importance_analysis(X_train)
+        feature_importance = self.feature_importance_analysis(X_train, y_train)
         results['feature_importance'] = feature_importance.to_dict('records')
         
         # Save model
@@ -2,10 +2,20 @@
 Configuration management utilities for the fantasy football analytics tool.
 """
 
+import copy
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Set, Tuple
+
+# Parsed configurations keyed by (resolved path, modification time)
+_CONFIG_CACHE: Dict[Tuple[Path, int], Dict[str, Any]] = {}
+
+# libyaml's C loader when PyYAML was built with it; same safe subset of YAML
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Directories already created by ensure_directories, as absolute paths
+_ENSURED_DIRECTORIES: Set[str] = set()
 
 
 def load_config(config_path: str = "config/config.yaml") -> Dict[str, Any]:
@@ -20,13 +30,17 @@ def load_config(config_path: str = "config/config.yaml") -> Dict[str, Any]:
     """
     config_file = Path(config_path)
     
-    if not config_file.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        cache_key = (config_file.resolve(), config_file.stat().st_mtime_ns)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
-    with open(config_file, 'r') as file:
-        config = yaml.safe_load(file)
+    # Each component loads the same file; parse it once and hand out copies
+    if cache_key not in _CONFIG_CACHE:
+        with open(config_file, 'r') as file:
+            _CONFIG_CACHE[cache_key] = yaml.load(file, Loader=_YAML_LOADER)
     
-    return config
+    return copy.deepcopy(_CONFIG_CACHE[cache_key])
 
 
 def get_data_paths(config: Dict[str, Any]) -> Dict[str, Path]:
@@ -53,13 +67,22 @@ def ensure_directories(config: Dict[str, Any]) -> None:
     """
     Ensure all required directories exist.
     
+    Each directory is created at most once per process; clear
+    _ENSURED_DIRECTORIES if directories may have been removed since.
+    
     Args:
         config: Configuration dictionary
     """
     paths = get_data_paths(config)
     
     for path in paths.values():
+        # abspath is pure string work, so repeat calls cost no syscalls
+        abs_path = os.path.abspath(path)
+        if abs_path in _ENSURED_DIRECTORIES:
+            continue
+        
         path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRECTORIES.add(abs_path)
 
 
 def get_model_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,31 @@
+"""
+File output utilities for the fantasy football analytics tool.
+"""
+
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+
+def write_csv(df: pd.DataFrame, output_path: Union[str, Path]) -> None:
+    """
+    Write a DataFrame to CSV without its index.
+
+    Uses PyArrow's multithreaded C++ writer, falling back to pandas when
+    PyArrow is unavailable or cannot convert a column.
+
+    Args:
+        df: DataFrame to write
+        output_path: Destination file path
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (ImportError, TypeError, ValueError):
+        df.to_csv(output_path, index=False)
+        return
+
+    pacsv.write_csv(table, str(output_path))
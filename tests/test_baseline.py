@@ -2,6 +2,7 @@
 Simple tests for the fantasy football analytics baseline model.
 """
 
+import functools
 import sys
 from pathlib import Path
 import pandas as pd
@@ -15,6 +16,18 @@ from src.features.feature_engineering import FeatureEngineer
 from src.models.baseline_model import BaselineModel
 
 
+@functools.lru_cache(maxsize=None)
+def _sample_data():
+    """Raw and engineered sample data, built once and shared by the tests."""
+    collector = FantasyDataCollector()
+    raw_data = collector.create_sample_data()
+    
+    engineer = FeatureEngineer()
+    engineered_data = engineer.engineer_all_features(raw_data)
+    
+    return raw_data, engineered_data
+
+
 def test_data_collection():
     """Test that data collection works."""
     print("Testing data collection...")
@@ -34,13 +47,8 @@ def test_feature_engineering():
     """Test that feature engineering works."""
     print("Testing feature engineering...")
     
-    # Create sample data
-    collector = FantasyDataCollector()
-    raw_data = collector.create_sample_data()
-    
-    # Engineer features
-    engineer = FeatureEngineer()
-    engineered_data = engineer.engineer_all_features(raw_data)
+    # Create sample data and engineer features
+    raw_data, engineered_data = _sample_data()
     
     assert len(engineered_data.columns) > len(raw_data.columns)
     assert 'target' in engineered_data.columns
@@ -54,11 +62,7 @@ def test_model_training():
     print("Testing model training...")
     
     # Create sample data and engineer features
-    collector = FantasyDataCollector()
-    raw_data = collector.create_sample_data()
-    
-    engineer = FeatureEngineer()
-    engineered_data = engineer.engineer_all_features(raw_data)
+    _, engineered_data = _sample_data()
     
     # Train model
     model = BaselineModel()
@@ -76,6 +80,173 @@ def test_model_training():
     print("✓ Model training test passed")
 
 
+def _small_forest_model(n_estimators):
+    """Baseline model configured for a small random forest."""
+    model = BaselineModel()
+    model.model_config['random_forest']['n_estimators'] = n_estimators
+    return model
+
+
+def test_incremental_training_grows_forest():
+    """Test that incremental training keeps the trees already fit."""
+    _, engineered_data = _sample_data()
+    model = _small_forest_model(20)
+    X, y = model.prepare_features(engineered_data)
+    
+    first_trees = model.train_model(X, y, incremental=True).estimators_
+    model.model_config['random_forest']['n_estimators'] = 30
+    forest = model.train_model(X, y, incremental=True)
+    
+    assert len(forest.estimators_) == 30
+    assert all(a is b for a, b in zip(forest.estimators_[:20], first_trees))
+    
+    # An equal copy of the data, including a bool column, is the same data
+    X = X.assign(flag=X.iloc[:, 0] > 0)
+    first_trees = model.train_model(X, y, incremental=True).estimators_
+    model.model_config['random_forest']['n_estimators'] = 40
+    forest = model.train_model(X.copy(), y.copy(), incremental=True)
+    assert all(a is b for a, b in zip(forest.estimators_[:30], first_trees))
+
+
+def test_incremental_training_rebuilds_on_change():
+    """Test that a parameter or data change rebuilds the forest."""
+    _, engineered_data = _sample_data()
+    model = _small_forest_model(20)
+    X, y = model.prepare_features(engineered_data)
+    
+    # Different parameters
+    first_trees = model.train_model(X, y, incremental=True).estimators_
+    model.model_config['random_forest']['n_estimators'] = 30
+    model.model_config['random_forest']['max_depth'] = 5
+    forest = model.train_model(X, y, incremental=True)
+    assert len(forest.estimators_) == 30
+    assert forest.estimators_[0] is not first_trees[0]
+    
+    # Different training data
+    first_trees = forest.estimators_
+    model.model_config['random_forest']['n_estimators'] = 40
+    forest = model.train_model(X.iloc[:-10], y.iloc[:-10], incremental=True)
+    assert len(forest.estimators_) == 40
+    assert forest.estimators_[0] is not first_trees[0]
+
+
+def test_max_leaf_nodes_auto():
+    """Test that the 'auto' leaf cap scales with the training set."""
+    _, engineered_data = _sample_data()
+    model = _small_forest_model(10)
+    model.model_config['random_forest']['max_leaf_nodes'] = 'auto'
+    X, y = model.prepare_features(engineered_data)
+    
+    forest = model.train_model(X, y)
+    
+    max_leaves = max(32, int(np.sqrt(len(X))))
+    assert forest.max_leaf_nodes == max_leaves
+    assert all(tree.tree_.n_leaves <= max_leaves for tree in forest.estimators_)
+
+
+def test_hist_gradient_boosting_trains_and_saves(tmp_path):
+    """Test that the histogram gradient boosting config trains and saves."""
+    from sklearn.ensemble import HistGradientBoostingClassifier
+    
+    _, engineered_data = _sample_data()
+    model = BaselineModel()
+    model.model_config['algorithm'] = 'HistGradientBoostingClassifier'
+    model.model_config['hist_gradient_boosting']['max_iter'] = 20
+    model.paths['models'] = tmp_path
+    X, y = model.prepare_features(engineered_data)
+    
+    trained = model.train_model(X, y)
+    assert isinstance(trained, HistGradientBoostingClassifier)
+    
+    model_path = model.save_model("hgb_model.joblib")
+    loaded = BaselineModel()
+    loaded.load_model(model_path)
+    assert loaded.feature_columns == model.feature_columns
+    np.testing.assert_array_equal(loaded.model.predict(X[:10]), trained.predict(X[:10]))
+
+
+def _install_onnx_stubs(monkeypatch, convert_sklearn, inference_session=None):
+    """Install stand-in skl2onnx and onnxruntime modules."""
+    import types
+    
+    data_types = types.ModuleType('skl2onnx.common.data_types')
+    data_types.FloatTensorType = lambda shape: shape
+    skl2onnx = types.ModuleType('skl2onnx')
+    skl2onnx.convert_sklearn = convert_sklearn
+    onnxruntime = types.ModuleType('onnxruntime')
+    onnxruntime.InferenceSession = inference_session
+    monkeypatch.setitem(sys.modules, 'onnxruntime', onnxruntime)
+    monkeypatch.setitem(sys.modules, 'skl2onnx', skl2onnx)
+    monkeypatch.setitem(sys.modules, 'skl2onnx.common', types.ModuleType('skl2onnx.common'))
+    monkeypatch.setitem(sys.modules, 'skl2onnx.common.data_types', data_types)
+
+
+def test_save_model_survives_onnx_failure(tmp_path, monkeypatch):
+    """Test that a failed ONNX export does not break saving the model."""
+    def convert_sklearn(*args, **kwargs):
+        raise RuntimeError("conversion failed")
+    
+    _install_onnx_stubs(monkeypatch, convert_sklearn)
+    _, engineered_data = _sample_data()
+    model = _small_forest_model(5)
+    model.paths['models'] = tmp_path
+    X, y = model.prepare_features(engineered_data)
+    model.train_model(X, y)
+    
+    model_path = model.save_model()
+    
+    assert model_path.exists()
+    assert model._onnx_session is None
+    assert model.enable_onnx_inference(model_path) is False
+
+
+def test_onnx_export_follows_model_mtime(tmp_path, monkeypatch):
+    """Test that each version of the joblib model gets its own ONNX export."""
+    import os
+    import types
+    
+    exports = []
+    
+    def convert_sklearn(*args, **kwargs):
+        exports.append(args[0])
+        return types.SimpleNamespace(SerializeToString=lambda: b"onnx")
+    
+    _install_onnx_stubs(monkeypatch, convert_sklearn, lambda path, providers: path)
+    
+    _, engineered_data = _sample_data()
+    model = _small_forest_model(5)
+    model.paths['models'] = tmp_path
+    X, y = model.prepare_features(engineered_data)
+    model.train_model(X, y)
+    model_path = model.save_model()
+    first_session = model._onnx_session
+    
+    # The same version reuses its export
+    assert model.enable_onnx_inference(model_path)
+    assert len(exports) == 1
+    
+    # A restored joblib with an older mtime is exported again
+    os.utime(model_path, ns=(1, 1))
+    assert model.enable_onnx_inference(model_path)
+    assert len(exports) == 2
+    assert model._onnx_session != first_session
+    assert [p.name for p in tmp_path.glob("*.onnx")] == [f"{model_path.stem}.1.onnx"]
+
+
+def test_csv_cache_ignores_sibling_parquet(tmp_path):
+    """Test that loading a CSV never returns a Parquet file saved beside it."""
+    model = BaselineModel()
+    model.paths['processed_data'] = tmp_path
+    
+    csv_file = tmp_path / "engineered_rb_data.csv"
+    pd.DataFrame({'value': np.arange(30), 'target': 0}).to_csv(csv_file, index=False)
+    pd.DataFrame({'value': np.arange(10), 'target': 0}).to_parquet(csv_file.with_suffix('.parquet'))
+    
+    # The second load is served from the private Parquet copy
+    assert len(model.load_data(str(csv_file))) == 30
+    assert len(model.load_data(str(csv_file))) == 30
+
+
 def run_all_tests():
     """Run all tests."""
     print("Running fantasy football analytics tests...")